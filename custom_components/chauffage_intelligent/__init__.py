@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Mapping
 from datetime import timedelta
+from typing import Any
 
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import config_validation as cv
 
 from .const import (
     CONF_CALENDAR,
@@ -28,22 +33,37 @@ from .coordinator import ChauffageIntelligentCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.CLIMATE, Platform.SENSOR, Platform.BINARY_SENSOR, Platform.SELECT]
+PLATFORMS = (Platform.CLIMATE, Platform.SENSOR, Platform.BINARY_SENSOR, Platform.SELECT)
+
+SET_MODE_SCHEMA = vol.Schema(
+    {
+        vol.Required("piece"): cv.string,
+        vol.Required("mode"): vol.In(MODES),
+        vol.Optional("duree"): cv.positive_int,
+    }
+)
+
+RESET_MODE_SCHEMA = vol.Schema({vol.Optional("piece"): cv.string})
+
+
+def _build_config(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Resolve the coordinator configuration from the config entry data."""
+    return {
+        CONF_CALENDAR: data[CONF_CALENDAR],
+        CONF_PRESENCE_TRACKERS: data[CONF_PRESENCE_TRACKERS],
+        CONF_PIECES: data.get(CONF_PIECES, {}),
+        CONF_SECURITY_FACTOR: data.get(CONF_SECURITY_FACTOR, DEFAULT_SECURITY_FACTOR),
+        CONF_MIN_PREHEAT_TIME: data.get(CONF_MIN_PREHEAT_TIME, DEFAULT_MIN_PREHEAT_TIME),
+        CONF_UPDATE_INTERVAL: data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+        CONF_DERIVATIVE_WINDOW: data.get(CONF_DERIVATIVE_WINDOW, DEFAULT_DERIVATIVE_WINDOW),
+    }
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Chauffage Intelligent from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    config = {
-        CONF_CALENDAR: entry.data[CONF_CALENDAR],
-        CONF_PRESENCE_TRACKERS: entry.data[CONF_PRESENCE_TRACKERS],
-        CONF_PIECES: entry.data.get(CONF_PIECES, {}),
-        CONF_SECURITY_FACTOR: entry.data.get(CONF_SECURITY_FACTOR, DEFAULT_SECURITY_FACTOR),
-        CONF_MIN_PREHEAT_TIME: entry.data.get(CONF_MIN_PREHEAT_TIME, DEFAULT_MIN_PREHEAT_TIME),
-        CONF_UPDATE_INTERVAL: entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
-        CONF_DERIVATIVE_WINDOW: entry.data.get(CONF_DERIVATIVE_WINDOW, DEFAULT_DERIVATIVE_WINDOW),
-    }
+    config = _build_config(entry.data)
 
     coordinator = ChauffageIntelligentCoordinator(
         hass,
@@ -51,40 +71,72 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval=timedelta(seconds=config[CONF_UPDATE_INTERVAL]),
     )
 
-    await coordinator.async_config_entry_first_refresh()
-
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    setups = [hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)]
 
-    # Register services
-    await _async_setup_services(hass, coordinator)
+    # Services are shared by all entries, register them only once
+    if not hass.services.has_service(DOMAIN, "set_mode"):
+        setups.append(_async_setup_services(hass))
+
+    # Register services while the platforms are being set up
+    await asyncio.gather(*setups)
+
+    # Entities restore their last state, so the first refresh (calendar and
+    # radiator calls) does not need to delay the setup
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), name=f"{DOMAIN}_first_refresh"
+    )
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply updated settings, reloading only when rooms or sources changed."""
+    coordinator: ChauffageIntelligentCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if coordinator.async_update_settings(_build_config(entry.data)):
+        await coordinator.async_request_refresh()
+    else:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
+        # Remove the shared services with the last entry
+        if not hass.data[DOMAIN]:
+            for service in ("set_mode", "reset_mode", "refresh"):
+                hass.services.async_remove(DOMAIN, service)
+
     return unload_ok
 
 
-async def _async_setup_services(
-    hass: HomeAssistant, coordinator: ChauffageIntelligentCoordinator
-) -> None:
+def _get_coordinator_for_piece(
+    hass: HomeAssistant, piece: str
+) -> ChauffageIntelligentCoordinator | None:
+    """Find the coordinator managing a room."""
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        if piece in coordinator.pieces:
+            return coordinator
+    return None
+
+
+async def _async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Chauffage Intelligent."""
 
     async def handle_set_mode(call: ServiceCall) -> None:
         """Handle set_mode service call."""
-        piece = call.data.get("piece")
-        mode = call.data.get("mode")
+        piece = call.data["piece"]
+        mode = call.data["mode"]
         duree = call.data.get("duree")
 
-        if mode not in MODES:
-            _LOGGER.error("Invalid mode: %s", mode)
+        coordinator = _get_coordinator_for_piece(hass, piece)
+        if coordinator is None:
+            _LOGGER.error("Unknown room: %s", piece)
             return
 
         await coordinator.async_set_mode_override(piece, mode, duree)
@@ -92,12 +144,33 @@ async def _async_setup_services(
     async def handle_reset_mode(call: ServiceCall) -> None:
         """Handle reset_mode service call."""
         piece = call.data.get("piece")
+
+        if piece is None:
+            # Reset all rooms of every entry
+            for coordinator in hass.data.get(DOMAIN, {}).values():
+                await coordinator.async_reset_mode_override()
+            return
+
+        coordinator = _get_coordinator_for_piece(hass, piece)
+        if coordinator is None:
+            _LOGGER.error("Unknown room: %s", piece)
+            return
+
         await coordinator.async_reset_mode_override(piece)
 
     async def handle_refresh(call: ServiceCall) -> None:
         """Handle refresh service call."""
-        await coordinator.async_request_refresh()
-
-    hass.services.async_register(DOMAIN, "set_mode", handle_set_mode)
-    hass.services.async_register(DOMAIN, "reset_mode", handle_reset_mode)
+        # The coordinator debouncer coalesces bursts, never block the caller
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            # A forced refresh also picks up calendar edits
+            coordinator.async_invalidate_calendar()
+            hass.async_create_background_task(
+                coordinator.async_request_refresh(),
+                name=f"{DOMAIN}_refresh",
+            )
+
+    hass.services.async_register(DOMAIN, "set_mode", handle_set_mode, schema=SET_MODE_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, "reset_mode", handle_reset_mode, schema=RESET_MODE_SCHEMA
+    )
     hass.services.async_register(DOMAIN, "refresh", handle_refresh)
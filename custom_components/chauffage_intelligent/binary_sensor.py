@@ -8,15 +8,17 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import (
     CONF_PIECE_NAME,
     DOMAIN,
 )
 from .coordinator import ChauffageIntelligentCoordinator
+from .entity import ChauffageIntelligentEntity, ChauffageIntelligentPieceEntity
 
 
 async def async_setup_entry(
@@ -29,24 +31,37 @@ async def async_setup_entry(
         config_entry.entry_id
     ]
 
-    entities: list[BinarySensorEntity] = []
+    # Global presence sensor, then per-room preheat active sensors
+    async_add_entities(
+        [
+            HomeOccupiedSensor(coordinator),
+            *(
+                RoomPreheatActiveSensor(coordinator, piece_id, piece_config)
+                for piece_id, piece_config in coordinator.pieces.items()
+            ),
+        ]
+    )
 
-    # Global presence sensor
-    entities.append(HomeOccupiedSensor(coordinator))
 
-    # Per-room preheat active sensors
-    for piece_id, piece_config in coordinator.pieces.items():
-        entities.append(RoomPreheatActiveSensor(coordinator, piece_id, piece_config))
+class RestoreIsOnEntity(RestoreEntity):
+    """Mixin restoring a binary sensor state until the first refresh completes."""
 
-    async_add_entities(entities)
+    coordinator: ChauffageIntelligentCoordinator
+    _attr_is_on: bool | None
 
+    async def async_added_to_hass(self) -> None:
+        """Seed is_on from the last known state while the coordinator has no data."""
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            return
+        last_state = await self.async_get_last_state()
+        if last_state is not None and last_state.state in (STATE_ON, STATE_OFF):
+            self._attr_is_on = last_state.state == STATE_ON
 
-class HomeOccupiedSensor(
-    CoordinatorEntity[ChauffageIntelligentCoordinator], BinarySensorEntity
-):
+
+class HomeOccupiedSensor(ChauffageIntelligentEntity, BinarySensorEntity, RestoreIsOnEntity):
     """Binary sensor showing if anyone is home."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
 
     def __init__(self, coordinator: ChauffageIntelligentCoordinator) -> None:
@@ -54,21 +69,23 @@ class HomeOccupiedSensor(
         super().__init__(coordinator)
         self._attr_unique_id = f"{DOMAIN}_maison_occupee"
         self._attr_name = "Chauffage Maison Occupée"
+        self._update_from_coordinator()
+
+    def _state_fingerprint(self) -> bool | None:
+        """Return the state compared to skip no-op writes."""
+        return self._attr_is_on
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if someone is home."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get("maison_occupee")
+    def _update_from_coordinator(self) -> None:
+        """Resolve whether someone is home once per update."""
+        data = self.coordinator.data
+        self._attr_is_on = data.get("maison_occupee") if data is not None else None
 
 
 class RoomPreheatActiveSensor(
-    CoordinatorEntity[ChauffageIntelligentCoordinator], BinarySensorEntity
+    ChauffageIntelligentPieceEntity, BinarySensorEntity, RestoreIsOnEntity
 ):
     """Binary sensor showing if preheating is active for a room."""
 
-    _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.HEAT
 
     def __init__(
@@ -78,15 +95,16 @@ class RoomPreheatActiveSensor(
         piece_config: dict[str, Any],
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._piece_id = piece_id
+        super().__init__(coordinator, piece_id)
         self._attr_unique_id = f"{DOMAIN}_{piece_id}_prechauffage_actif"
         self._attr_name = f"{piece_config.get(CONF_PIECE_NAME, piece_id)} Préchauffage Actif"
+        self._update_from_coordinator()
+
+    def _state_fingerprint(self) -> bool | None:
+        """Return the state compared to skip no-op writes."""
+        return self._attr_is_on
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if preheating is active."""
-        if self.coordinator.data is None:
-            return None
-        piece_data = self.coordinator.data.get("pieces", {}).get(self._piece_id)
-        return piece_data.get("prechauffage_actif") if piece_data else None
+    def _update_from_coordinator(self) -> None:
+        """Resolve whether preheating is active once per update."""
+        piece_data = self.coordinator.piece_data(self._piece_id)
+        self._attr_is_on = piece_data.get("prechauffage_actif") if piece_data else None
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.climate import (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_PRESET_MODE,
     ClimateEntity,
     ClimateEntityFeature,
     HVACMode,
@@ -13,7 +17,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import (
     CONF_PIECE_NAME,
@@ -29,7 +33,8 @@ from .const import (
     MODE_OFF,
     SOURCE_OVERRIDE,
 )
-from .coordinator import ChauffageIntelligentCoordinator
+from .coordinator import ChauffageIntelligentCoordinator, as_radiator_list
+from .entity import ChauffageIntelligentPieceEntity
 
 # Preset mode labels (French)
 PRESET_AUTO = "Automatique"
@@ -37,22 +42,19 @@ PRESET_CONFORT = "Confort"
 PRESET_ECO = "Éco"
 PRESET_HORS_GEL = "Hors-gel"
 
-PRESET_MODES = [PRESET_AUTO, PRESET_CONFORT, PRESET_ECO, PRESET_HORS_GEL]
+PRESET_MODES = (PRESET_AUTO, PRESET_CONFORT, PRESET_ECO, PRESET_HORS_GEL)
 
-# Mapping between preset labels and internal modes
-PRESET_TO_MODE = {
-    PRESET_AUTO: MODE_AUTO,
-    PRESET_CONFORT: MODE_CONFORT,
-    PRESET_ECO: MODE_ECO,
-    PRESET_HORS_GEL: MODE_HORS_GEL,
-}
+# Read-only mapping between preset labels and internal modes
+PRESET_TO_MODE = MappingProxyType(
+    {
+        PRESET_AUTO: MODE_AUTO,
+        PRESET_CONFORT: MODE_CONFORT,
+        PRESET_ECO: MODE_ECO,
+        PRESET_HORS_GEL: MODE_HORS_GEL,
+    }
+)
 
-MODE_TO_PRESET = {
-    MODE_AUTO: PRESET_AUTO,
-    MODE_CONFORT: PRESET_CONFORT,
-    MODE_ECO: PRESET_ECO,
-    MODE_HORS_GEL: PRESET_HORS_GEL,
-}
+MODE_TO_PRESET = MappingProxyType({mode: preset for preset, mode in PRESET_TO_MODE.items()})
 
 
 async def async_setup_entry(
@@ -71,14 +73,11 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ChauffageIntelligentClimate(
-    CoordinatorEntity[ChauffageIntelligentCoordinator], ClimateEntity
-):
+class ChauffageIntelligentClimate(ChauffageIntelligentPieceEntity, ClimateEntity, RestoreEntity):
     """Climate entity for a room managed by Chauffage Intelligent."""
 
-    _attr_has_entity_name = True
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    _attr_hvac_modes = [HVACMode.HEAT, HVACMode.OFF]
+    _attr_hvac_modes = (HVACMode.HEAT, HVACMode.OFF)
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
     )
@@ -91,94 +90,94 @@ class ChauffageIntelligentClimate(
         piece_config: dict[str, Any],
     ) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator)
-        self._piece_id = piece_id
-        self._piece_config = piece_config
+        super().__init__(coordinator, piece_id)
 
         self._attr_unique_id = f"{DOMAIN}_{piece_id}"
         self._attr_name = f"Chauffage {piece_config.get(CONF_PIECE_NAME, piece_id)}"
 
-        # Set temperature limits
+        # Mode thresholds used to map a setpoint back to a mode
         temps = piece_config.get(CONF_PIECE_TEMPERATURES, {})
-        self._attr_min_temp = temps.get(MODE_HORS_GEL, 7)
+        self._t_confort = temps.get(MODE_CONFORT, 19)
+        self._t_eco = temps.get(MODE_ECO, 17)
+        self._t_hors_gel = temps.get(MODE_HORS_GEL, 7)
+
+        # Set temperature limits
+        self._attr_min_temp = self._t_hors_gel
         self._attr_max_temp = temps.get(MODE_CONFORT, 22) + 2
 
-    @property
-    def _piece_data(self) -> dict[str, Any] | None:
-        """Get current data for this room from coordinator."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get("pieces", {}).get(self._piece_id)
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        if self._piece_data:
-            return self._piece_data.get("temperature")
-        return None
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
-        if self._piece_data:
-            return self._piece_data.get("consigne")
-        return None
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return current HVAC mode."""
-        if self._piece_data:
-            mode = self._piece_data.get("mode")
-            if mode == MODE_OFF:
-                return HVACMode.OFF
-        return HVACMode.HEAT
-
-    @property
-    def preset_mode(self) -> str | None:
-        """Return current preset mode."""
-        if self._piece_data is None:
-            return PRESET_AUTO
-
-        source = self._piece_data.get("source")
-        if source == SOURCE_OVERRIDE:
-            current_mode = self._piece_data.get("mode")
-            if current_mode and current_mode in MODE_TO_PRESET:
-                return MODE_TO_PRESET[current_mode]
-
-        return PRESET_AUTO
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        # Handle both new list format and legacy single radiator format
-        radiateurs = self._piece_config.get(CONF_PIECE_RADIATEURS, [])
-        if isinstance(radiateurs, str):
-            radiateurs = [radiateurs]
-
-        attrs = {
-            "radiateur_entities": radiateurs,
-            "sonde_entity": self._piece_config.get(CONF_PIECE_SONDE),
-            "type_piece": self._piece_config.get(CONF_PIECE_TYPE),
-        }
-
-        if self._piece_data:
-            attrs.update(
-                {
-                    "mode_calcule": self._piece_data.get("mode"),
-                    "source_mode": self._piece_data.get("source"),
-                    "temperature_cible": self._piece_data.get("consigne"),
-                    "temperature_actuelle": self._piece_data.get("temperature"),
-                    "vitesse_chauffe": self._piece_data.get("vitesse_chauffe"),
-                    "vitesse_apprise": self._piece_data.get("vitesse_apprise"),
-                    "temps_prechauffage": self._piece_data.get("temps_prechauffage"),
-                    "prechauffage_actif": self._piece_data.get("prechauffage_actif"),
-                    "prochain_evenement": self._piece_data.get("prochain_evenement"),
-                    "learning_samples": self._piece_data.get("learning_samples"),
-                    "learning_avg_rate": self._piece_data.get("learning_avg_rate"),
-                }
-            )
-
-        return attrs
+        # Read-only attributes that only depend on the room configuration
+        self._static_attrs: Mapping[str, Any] = MappingProxyType(
+            {
+                # Handle both new list format and legacy single radiator format
+                "radiateur_entities": as_radiator_list(piece_config.get(CONF_PIECE_RADIATEURS)),
+                "sonde_entity": piece_config.get(CONF_PIECE_SONDE),
+                "type_piece": piece_config.get(CONF_PIECE_TYPE),
+            }
+        )
+
+        self._piece_data: dict[str, Any] | None = None
+        self._update_from_coordinator()
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last known state until the first refresh completes."""
+        await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            return
+        if (last_state := await self.async_get_last_state()) is None:
+            return
+
+        attributes = last_state.attributes
+        self._attr_current_temperature = attributes.get(ATTR_CURRENT_TEMPERATURE)
+        self._attr_target_temperature = attributes.get(ATTR_TEMPERATURE)
+        if last_state.state in self._attr_hvac_modes:
+            self._attr_hvac_mode = HVACMode(last_state.state)
+        if attributes.get(ATTR_PRESET_MODE) in PRESET_MODES:
+            self._attr_preset_mode = attributes[ATTR_PRESET_MODE]
+
+    def _state_fingerprint(self) -> Mapping[str, Any]:
+        """Return the state compared to skip no-op writes."""
+        # The attributes carry every value derived from the room data
+        return self._attr_extra_state_attributes
+
+    def _update_from_coordinator(self) -> None:
+        """Resolve this room's data and derived state once per update."""
+        piece_data = self.coordinator.piece_data(self._piece_id)
+        self._piece_data = piece_data
+
+        if not piece_data:
+            self._attr_current_temperature = None
+            self._attr_target_temperature = None
+            self._attr_hvac_mode = HVACMode.HEAT
+            self._attr_preset_mode = PRESET_AUTO
+            self._attr_extra_state_attributes = self._static_attrs
+            return
+
+        mode = piece_data.get("mode")
+        source = piece_data.get("source")
+        self._attr_current_temperature = piece_data.get("temperature")
+        self._attr_target_temperature = piece_data.get("consigne")
+        self._attr_hvac_mode = HVACMode.OFF if mode == MODE_OFF else HVACMode.HEAT
+        # Only a manual override maps to a fixed preset
+        self._attr_preset_mode = (
+            MODE_TO_PRESET.get(mode, PRESET_AUTO) if source == SOURCE_OVERRIDE else PRESET_AUTO
+        )
+
+        self._attr_extra_state_attributes = MappingProxyType(
+            {
+                **self._static_attrs,
+                "mode_calcule": mode,
+                "source_mode": source,
+                "temperature_cible": piece_data.get("consigne"),
+                "temperature_actuelle": piece_data.get("temperature"),
+                "vitesse_chauffe": piece_data.get("vitesse_chauffe"),
+                "vitesse_apprise": piece_data.get("vitesse_apprise"),
+                "temps_prechauffage": piece_data.get("temps_prechauffage"),
+                "prechauffage_actif": piece_data.get("prechauffage_actif"),
+                "prochain_evenement": piece_data.get("prochain_evenement"),
+                "learning_samples": piece_data.get("learning_samples"),
+                "learning_avg_rate": piece_data.get("learning_avg_rate"),
+            }
+        )
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature (manual override)."""
@@ -187,11 +186,9 @@ class ChauffageIntelligentClimate(
             return
 
         # Determine which mode this temperature corresponds to
-        temps = self._piece_config.get(CONF_PIECE_TEMPERATURES, {})
-
-        if temperature >= temps.get(MODE_CONFORT, 19):
+        if temperature >= self._t_confort:
             mode = MODE_CONFORT
-        elif temperature >= temps.get(MODE_ECO, 17):
+        elif temperature >= self._t_eco:
             mode = MODE_ECO
         else:
             mode = MODE_HORS_GEL
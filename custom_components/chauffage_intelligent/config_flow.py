@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import selector
 
@@ -31,110 +35,339 @@ from .const import (
     DEFAULT_SECURITY_FACTOR,
     DEFAULT_TEMPERATURES,
     DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL_MINUTES,
     DOMAIN,
     MODE_CONFORT,
     MODE_ECO,
     MODE_HORS_GEL,
     ROOM_TYPES,
 )
+from .coordinator import as_radiator_list
 
 _LOGGER = logging.getLogger(__name__)
 
 # Menu actions
 ACTION_ADD_ROOM = "add_room"
+ACTION_ADD_ALL_ROOMS = "add_all_rooms"
 ACTION_FINISH = "finish"
 
 
-def _get_areas_with_climate(hass) -> list[dict[str, str]]:
-    """Get areas that have climate entities."""
-    area_reg = ar.async_get(hass)
-    entity_reg = er.async_get(hass)
+def _dropdown(options: list[Any], multiple: bool = False) -> selector.SelectSelector:
+    """Build a dropdown selector for the given options."""
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=options,
+            multiple=multiple,
+            mode=selector.SelectSelectorMode.DROPDOWN,
+        ),
+    )
 
-    # Find all areas with climate entities
-    areas_with_climate = set()
-    for entity in entity_reg.entities.values():
-        if entity.domain == "climate" and entity.area_id:
-            areas_with_climate.add(entity.area_id)
 
-    # Also check device areas
-    from homeassistant.helpers import device_registry as dr
+@lru_cache(maxsize=16)
+def _entity_dropdown(entity_ids: tuple[str, ...], multiple: bool = False) -> selector.SelectSelector:
+    """Build a dropdown of entity IDs, shared by renders offering the same entities."""
+    return _dropdown(list(entity_ids), multiple)
 
-    device_reg = dr.async_get(hass)
 
-    for entity in entity_reg.entities.values():
-        if entity.domain == "climate" and entity.device_id:
-            device = device_reg.async_get(entity.device_id)
-            if device and device.area_id:
-                areas_with_climate.add(device.area_id)
+def _minutes_to_seconds(minutes: float) -> float:
+    """Convert an update interval entered in minutes to the stored seconds."""
+    return minutes * 60
 
-    # Build list of area options
-    area_options = []
-    for area_id in areas_with_climate:
-        area = area_reg.async_get_area(area_id)
-        if area:
-            area_options.append({"value": area.id, "label": area.name})
 
-    return sorted(area_options, key=lambda x: x["label"])
+# Selectors that do not depend on runtime data, shared by every form render
+_UPDATE_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=60, unit_of_measurement="min"),
+)
+_SECURITY_FACTOR_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1.0, max=2.0, step=0.1),
+)
+_MIN_PREHEAT_TIME_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=10, max=120, unit_of_measurement="min"),
+)
+_TEMP_CONFORT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=15, max=25, unit_of_measurement="°C"),
+)
+_TEMP_ECO_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=12, max=20, unit_of_measurement="°C"),
+)
+_TEMP_HORS_GEL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=5, max=12, unit_of_measurement="°C"),
+)
+_ROOM_TYPE_SELECTOR = _dropdown(list(ROOM_TYPES))
+_CONFIRM_SELECTOR = selector.BooleanSelector()
+
+_ROOM_MENU_ADD_OPTION = {"value": ACTION_ADD_ROOM, "label": "Ajouter une pièce"}
+_ROOM_MENU_ADD_ALL_OPTION = {
+    "value": ACTION_ADD_ALL_ROOMS,
+    "label": "Ajouter toutes les pièces détectées",
+}
+_ROOM_MENU_FINISH_OPTION = {"value": ACTION_FINISH, "label": "Terminer la configuration"}
+# The finish option is only offered once at least one room is configured
+_ROOM_MENU_SELECTORS = {
+    False: selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=[_ROOM_MENU_ADD_OPTION, _ROOM_MENU_ADD_ALL_OPTION],
+            mode=selector.SelectSelectorMode.LIST,
+        ),
+    ),
+    True: selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=[
+                _ROOM_MENU_ADD_OPTION,
+                _ROOM_MENU_ADD_ALL_OPTION,
+                _ROOM_MENU_FINISH_OPTION,
+            ],
+            mode=selector.SelectSelectorMode.LIST,
+        ),
+    ),
+}
+
+_INIT_MENU_OPTIONS = (
+    {"value": "add_room", "label": "Ajouter une pièce"},
+    {"value": "modify_room", "label": "Modifier une pièce"},
+    {"value": "delete_room", "label": "Supprimer une pièce"},
+    {"value": "modify_settings", "label": "Modifier les paramètres"},
+)
+_INIT_MENU_SCHEMA = vol.Schema(
+    {
+        vol.Required("action"): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=list(_INIT_MENU_OPTIONS),
+                mode=selector.SelectSelectorMode.LIST,
+            ),
+        ),
+    }
+)
 
 
-def _get_climate_entities_for_area(hass, area_id: str) -> list[str]:
-    """Get climate entity IDs for a specific area."""
+def _build_settings_schema(
+    calendars: list[str],
+    trackers: list[str],
+    *,
+    calendar: str = vol.UNDEFINED,
+    presence_trackers: list[str] = vol.UNDEFINED,
+    update_interval: int = DEFAULT_UPDATE_INTERVAL_MINUTES,
+    security_factor: float = DEFAULT_SECURITY_FACTOR,
+    min_preheat_time: int = DEFAULT_MIN_PREHEAT_TIME,
+) -> vol.Schema:
+    """Build the global settings form schema, pre-filled with the given defaults."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_CALENDAR, default=calendar): _entity_dropdown(tuple(calendars)),
+            vol.Required(CONF_PRESENCE_TRACKERS, default=presence_trackers): _entity_dropdown(
+                tuple(trackers), multiple=True
+            ),
+            vol.Optional(CONF_UPDATE_INTERVAL, default=update_interval): _UPDATE_INTERVAL_SELECTOR,
+            vol.Optional(CONF_SECURITY_FACTOR, default=security_factor): _SECURITY_FACTOR_SELECTOR,
+            vol.Optional(
+                CONF_MIN_PREHEAT_TIME, default=min_preheat_time
+            ): _MIN_PREHEAT_TIME_SELECTOR,
+        }
+    )
+
+
+def _build_room_schema(
+    climate_entities: list[str],
+    temp_sensors: list[str],
+    *,
+    piece_type: str = vol.UNDEFINED,
+    radiateurs: list[str] = vol.UNDEFINED,
+    sonde: str = vol.UNDEFINED,
+    temp_confort: float = 19,
+    temp_eco: float = 17,
+    temp_hors_gel: float = 7,
+) -> vol.Schema:
+    """Build the room form schema, pre-filled with the given defaults."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_PIECE_TYPE, default=piece_type): _ROOM_TYPE_SELECTOR,
+            vol.Required(CONF_PIECE_RADIATEURS, default=radiateurs): _entity_dropdown(
+                tuple(climate_entities), multiple=True
+            ),
+            vol.Optional(CONF_PIECE_SONDE, default=sonde): _entity_dropdown(tuple(temp_sensors)),
+            vol.Optional("temp_confort", default=temp_confort): _TEMP_CONFORT_SELECTOR,
+            vol.Optional("temp_eco", default=temp_eco): _TEMP_ECO_SELECTOR,
+            vol.Optional("temp_hors_gel", default=temp_hors_gel): _TEMP_HORS_GEL_SELECTOR,
+        }
+    )
+
+
+def _build_room_dict(
+    name: str | None, area_id: str | None, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Build a room configuration from the room form input."""
+    piece_type = user_input[CONF_PIECE_TYPE]
+    defaults = DEFAULT_TEMPERATURES[piece_type]
+    return {
+        CONF_PIECE_NAME: name,
+        CONF_PIECE_AREA_ID: area_id,
+        CONF_PIECE_TYPE: piece_type,
+        CONF_PIECE_RADIATEURS: as_radiator_list(user_input[CONF_PIECE_RADIATEURS]),
+        CONF_PIECE_SONDE: user_input.get(CONF_PIECE_SONDE),
+        CONF_PIECE_TEMPERATURES: {
+            MODE_CONFORT: user_input.get("temp_confort", defaults[MODE_CONFORT]),
+            MODE_ECO: user_input.get("temp_eco", defaults[MODE_ECO]),
+            MODE_HORS_GEL: user_input.get("temp_hors_gel", defaults[MODE_HORS_GEL]),
+        },
+    }
+
+
+def _build_room_options(pieces: dict[str, dict[str, Any]]) -> list[dict[str, str]]:
+    """Build select options for the configured rooms."""
+    return [
+        {"value": room_id, "label": room_config.get(CONF_PIECE_NAME, room_id)}
+        for room_id, room_config in pieces.items()
+    ]
+
+
+def _get_areas_with_climate(hass: HomeAssistant) -> list[dict[str, str]]:
+    """Get areas that have climate entities."""
+    area_reg = ar.async_get(hass)
     entity_reg = er.async_get(hass)
-    from homeassistant.helpers import device_registry as dr
+    get_device = dr.async_get(hass).async_get
 
-    device_reg = dr.async_get(hass)
-
-    climate_entities = []
+    # Find all areas with climate entities, directly or via their device
+    areas_with_climate: set[str] = set()
+    add_area = areas_with_climate.add
     for entity in entity_reg.entities.values():
         if entity.domain != "climate":
             continue
+        # Read each attribute once per entity
+        if area_id := entity.area_id:
+            add_area(area_id)
+        device = get_device(device_id) if (device_id := entity.device_id) else None
+        if device and (device_area_id := device.area_id):
+            add_area(device_area_id)
+
+    # Build list of area options straight from the registry mapping
+    areas = area_reg.areas
+    area_options = [
+        {"value": area.id, "label": area.name}
+        for area_id in areas_with_climate
+        if (area := areas.get(area_id)) is not None
+    ]
+
+    return sorted(area_options, key=itemgetter("label"))
+
+
+def _get_area_entries(
+    entity_reg: er.EntityRegistry, device_reg: dr.DeviceRegistry, area_id: str, domain: str
+) -> list[er.RegistryEntry]:
+    """Get registry entries of a domain in an area, directly or via their device."""
+    if not area_id:
+        return []
+
+    # Use the registry area and device indices instead of scanning every entity
+    entries = {
+        entry.entity_id: entry
+        for entry in er.async_entries_for_area(entity_reg, area_id)
+        if entry.domain == domain
+    }
+    for device in dr.async_entries_for_area(device_reg, area_id):
+        for entry in er.async_entries_for_device(
+            entity_reg, device.id, include_disabled_entities=True
+        ):
+            if entry.domain == domain:
+                entries.setdefault(entry.entity_id, entry)
+
+    return list(entries.values())
+
+
+def _get_climate_entities_for_area(
+    entity_reg: er.EntityRegistry, device_reg: dr.DeviceRegistry, area_id: str
+) -> list[str]:
+    """Get climate entity IDs for a specific area."""
+    return [
+        entry.entity_id
+        for entry in _get_area_entries(entity_reg, device_reg, area_id, "climate")
+    ]
+
 
-        # Check direct area assignment
-        if entity.area_id == area_id:
-            climate_entities.append(entity.entity_id)
+def _get_temperature_sensors_for_area(
+    entity_reg: er.EntityRegistry, device_reg: dr.DeviceRegistry, area_id: str
+) -> list[str]:
+    """Get temperature sensor entity IDs for a specific area."""
+    # The registry entry carries the device class, no need for the state machine
+    return [
+        entry.entity_id
+        for entry in _get_area_entries(entity_reg, device_reg, area_id, "sensor")
+        if (entry.device_class or entry.original_device_class) == "temperature"
+    ]
+
+
+def _get_all_temperature_sensors(hass: HomeAssistant, entity_reg: er.EntityRegistry) -> list[str]:
+    """Get all temperature sensor entity IDs."""
+    get_entry = entity_reg.async_get
+    get_state = hass.states.get
+    temp_sensors: list[str] = []
+    for entity_id in hass.states.async_entity_ids("sensor"):
+        if (entry := get_entry(entity_id)) is not None:
+            device_class = entry.device_class or entry.original_device_class
+        elif (state := get_state(entity_id)) is not None:
+            # Sensors without a unique ID are only known to the state machine
+            device_class = state.attributes.get("device_class")
+        else:
             continue
+        if device_class == "temperature":
+            temp_sensors.append(entity_id)
 
-        # Check device area
-        if entity.device_id:
-            device = device_reg.async_get(entity.device_id)
-            if device and device.area_id == area_id:
-                climate_entities.append(entity.entity_id)
+    return temp_sensors
 
-    return climate_entities
 
+class _RegistryLookupMixin:
+    """Memoize registry lookups for the lifetime of a flow."""
 
-def _get_temperature_sensors_for_area(hass, area_id: str) -> list[str]:
-    """Get temperature sensor entity IDs for a specific area."""
-    entity_reg = er.async_get(hass)
-    from homeassistant.helpers import device_registry as dr
+    hass: Any
+    _registry_cache: dict[tuple[str, str], list[Any]]
 
-    device_reg = dr.async_get(hass)
+    def _cached_lookup(
+        self, kind: str, area_id: str, lookup: Callable[[], list[Any]]
+    ) -> list[Any]:
+        """Return a registry lookup, computing it once per flow."""
+        key = (kind, area_id)
+        if key not in self._registry_cache:
+            self._registry_cache[key] = lookup()
+        return self._registry_cache[key]
 
-    sensors = []
-    for entity in entity_reg.entities.values():
-        if entity.domain != "sensor":
-            continue
+    @cached_property
+    def _registries(self) -> tuple[er.EntityRegistry, dr.DeviceRegistry]:
+        """Return the entity and device registries, resolved once per flow."""
+        return er.async_get(self.hass), dr.async_get(self.hass)
 
-        # Check if it's a temperature sensor
-        state = hass.states.get(entity.entity_id)
-        if not state or state.attributes.get("device_class") != "temperature":
-            continue
+    def _areas_with_climate(self) -> list[dict[str, str]]:
+        """Get areas that have climate entities."""
+        return self._cached_lookup("areas", "", lambda: _get_areas_with_climate(self.hass))
 
-        # Check direct area assignment
-        if entity.area_id == area_id:
-            sensors.append(entity.entity_id)
-            continue
+    def _climate_entities_for_area(self, area_id: str) -> list[str]:
+        """Get climate entity IDs for an area."""
+        return self._cached_lookup(
+            "climate", area_id, lambda: _get_climate_entities_for_area(*self._registries, area_id)
+        )
 
-        # Check device area
-        if entity.device_id:
-            device = device_reg.async_get(entity.device_id)
-            if device and device.area_id == area_id:
-                sensors.append(entity.entity_id)
+    def _temperature_sensors_for_area(self, area_id: str) -> list[str]:
+        """Get temperature sensor entity IDs for an area."""
+        return self._cached_lookup(
+            "sensor", area_id, lambda: _get_temperature_sensors_for_area(*self._registries, area_id)
+        )
 
-    return sensors
+    def _entity_ids(self, domain: str) -> list[str]:
+        """Get the sorted entity IDs of a domain from the state machine."""
+        return self._cached_lookup(
+            "entity_ids", domain, lambda: sorted(self.hass.states.async_entity_ids(domain))
+        )
 
+    def _all_temperature_sensors(self) -> list[str]:
+        """Get all temperature sensor entity IDs, sorted."""
+        return self._cached_lookup(
+            "all_sensors",
+            "",
+            lambda: sorted(_get_all_temperature_sensors(self.hass, self._registries[0])),
+        )
 
-class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+
+class ChauffageIntelligentConfigFlow(
+    _RegistryLookupMixin, config_entries.ConfigFlow, domain=DOMAIN
+):
     """Handle a config flow for Chauffage Intelligent."""
 
     VERSION = 1
@@ -144,6 +377,7 @@ class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._data: dict[str, Any] = {}
         self._current_area_id: str | None = None
         self._current_area_name: str | None = None
+        self._registry_cache = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -155,10 +389,9 @@ class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._data = {
                 CONF_CALENDAR: user_input[CONF_CALENDAR],
                 CONF_PRESENCE_TRACKERS: user_input[CONF_PRESENCE_TRACKERS],
-                CONF_UPDATE_INTERVAL: user_input.get(
-                    CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL // 60
-                )
-                * 60,
+                CONF_UPDATE_INTERVAL: _minutes_to_seconds(
+                    user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL_MINUTES)
+                ),
                 CONF_SECURITY_FACTOR: user_input.get(CONF_SECURITY_FACTOR, DEFAULT_SECURITY_FACTOR),
                 CONF_MIN_PREHEAT_TIME: user_input.get(
                     CONF_MIN_PREHEAT_TIME, DEFAULT_MIN_PREHEAT_TIME
@@ -169,49 +402,18 @@ class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_room_menu()
 
         # Get available calendars
-        calendars = [state.entity_id for state in self.hass.states.async_all("calendar")]
+        calendars = self._entity_ids("calendar")
 
         if not calendars:
             errors["base"] = "no_calendar"
 
         # Get available device trackers
-        trackers = [state.entity_id for state in self.hass.states.async_all("device_tracker")]
+        trackers = self._entity_ids("device_tracker")
 
         if not trackers:
             errors["base"] = "no_trackers"
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_CALENDAR): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=calendars,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Required(CONF_PRESENCE_TRACKERS): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=trackers,
-                        multiple=True,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Optional(
-                    CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL // 60
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=1, max=60, unit_of_measurement="min"),
-                ),
-                vol.Optional(
-                    CONF_SECURITY_FACTOR, default=DEFAULT_SECURITY_FACTOR
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=1.0, max=2.0, step=0.1),
-                ),
-                vol.Optional(
-                    CONF_MIN_PREHEAT_TIME, default=DEFAULT_MIN_PREHEAT_TIME
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=10, max=120, unit_of_measurement="min"),
-                ),
-            }
-        )
+        data_schema = _build_settings_schema(calendars, trackers)
 
         return self.async_show_form(
             step_id="user",
@@ -238,26 +440,15 @@ class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     )
             elif action == ACTION_ADD_ROOM:
                 return await self.async_step_select_area()
+            elif action == ACTION_ADD_ALL_ROOMS and not self._add_remaining_rooms():
+                errors["base"] = "no_areas_available"
 
-        num_rooms = len(self._data.get(CONF_PIECES, {}))
-
-        # Build menu options
-        menu_options = [
-            {"value": ACTION_ADD_ROOM, "label": "Ajouter une pièce"},
-        ]
-
-        # Only show finish option if at least one room is configured
-        if num_rooms > 0:
-            menu_options.append({"value": ACTION_FINISH, "label": "Terminer la configuration"})
+        pieces = self._data.get(CONF_PIECES)
+        num_rooms = len(pieces) if pieces else 0
 
         data_schema = vol.Schema(
             {
-                vol.Required("action"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=menu_options,
-                        mode=selector.SelectSelectorMode.LIST,
-                    ),
-                ),
+                vol.Required("action"): _ROOM_MENU_SELECTORS[num_rooms > 0],
             }
         )
 
@@ -273,6 +464,7 @@ class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> config_entries.FlowResult:
         """Handle area selection step."""
         errors = {}
+        pieces = self._data.get(CONF_PIECES) or {}
 
         if user_input is not None:
             area_id = user_input["area"]
@@ -281,7 +473,7 @@ class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             if area:
                 # Check if area is already configured
-                if area_id in self._data.get(CONF_PIECES, {}):
+                if area_id in pieces:
                     errors["base"] = "area_already_configured"
                 else:
                     self._current_area_id = area_id
@@ -289,21 +481,14 @@ class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     return await self.async_step_configure_room()
 
         # Get areas with climate entities, excluding already configured ones
-        area_options = _get_areas_with_climate(self.hass)
-        configured_areas = set(self._data.get(CONF_PIECES, {}).keys())
-        area_options = [a for a in area_options if a["value"] not in configured_areas]
+        area_options = [a for a in self._areas_with_climate() if a["value"] not in pieces]
 
         if not area_options:
             errors["base"] = "no_areas_available"
 
         data_schema = vol.Schema(
             {
-                vol.Required("area"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=area_options,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
+                vol.Required("area"): _dropdown(area_options),
             }
         )
 
@@ -313,6 +498,31 @@ class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    def _add_remaining_rooms(self) -> int:
+        """Add every unconfigured area with climate entities, return the count added."""
+        pieces = self._data.setdefault(CONF_PIECES, {})
+        added = 0
+        # One pass over the memoized area lookups, using the default room settings
+        for area in self._areas_with_climate():
+            area_id = area["value"]
+            if area_id in pieces:
+                continue
+            if not (radiateurs := self._climate_entities_for_area(area_id)):
+                continue
+            temp_sensors = self._temperature_sensors_for_area(area_id)
+            pieces[area_id] = _build_room_dict(
+                area["label"],
+                area_id,
+                {
+                    CONF_PIECE_TYPE: "autre",
+                    CONF_PIECE_RADIATEURS: radiateurs,
+                    CONF_PIECE_SONDE: temp_sensors[0] if temp_sensors else None,
+                },
+            )
+            added += 1
+
+        return added
+
     async def async_step_configure_room(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.FlowResult:
@@ -320,34 +530,9 @@ class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
-            piece_type = user_input[CONF_PIECE_TYPE]
-            radiateurs = user_input[CONF_PIECE_RADIATEURS]
-
-            # Ensure radiateurs is a list
-            if isinstance(radiateurs, str):
-                radiateurs = [radiateurs]
-
-            self._data[CONF_PIECES][self._current_area_id] = {
-                CONF_PIECE_NAME: self._current_area_name,
-                CONF_PIECE_AREA_ID: self._current_area_id,
-                CONF_PIECE_TYPE: piece_type,
-                CONF_PIECE_RADIATEURS: radiateurs,
-                CONF_PIECE_SONDE: user_input.get(CONF_PIECE_SONDE),
-                CONF_PIECE_TEMPERATURES: {
-                    MODE_CONFORT: user_input.get(
-                        "temp_confort",
-                        DEFAULT_TEMPERATURES[piece_type][MODE_CONFORT],
-                    ),
-                    MODE_ECO: user_input.get(
-                        "temp_eco",
-                        DEFAULT_TEMPERATURES[piece_type][MODE_ECO],
-                    ),
-                    MODE_HORS_GEL: user_input.get(
-                        "temp_hors_gel",
-                        DEFAULT_TEMPERATURES[piece_type][MODE_HORS_GEL],
-                    ),
-                },
-            }
+            self._data[CONF_PIECES][self._current_area_id] = _build_room_dict(
+                self._current_area_name, self._current_area_id, user_input
+            )
 
             # Reset current area and go back to menu
             self._current_area_id = None
@@ -355,43 +540,12 @@ class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_room_menu()
 
         # Get climate entities for this area
-        climate_entities = _get_climate_entities_for_area(self.hass, self._current_area_id or "")
+        climate_entities = self._climate_entities_for_area(self._current_area_id or "")
 
         # Get temperature sensors for this area
-        temp_sensors = _get_temperature_sensors_for_area(self.hass, self._current_area_id or "")
+        temp_sensors = self._temperature_sensors_for_area(self._current_area_id or "")
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_PIECE_TYPE): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=ROOM_TYPES,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Required(CONF_PIECE_RADIATEURS): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=climate_entities,
-                        multiple=True,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Optional(CONF_PIECE_SONDE): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=temp_sensors,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Optional("temp_confort", default=19): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=15, max=25, unit_of_measurement="°C"),
-                ),
-                vol.Optional("temp_eco", default=17): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=12, max=20, unit_of_measurement="°C"),
-                ),
-                vol.Optional("temp_hors_gel", default=7): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=5, max=12, unit_of_measurement="°C"),
-                ),
-            }
-        )
+        data_schema = _build_room_schema(climate_entities, temp_sensors)
 
         return self.async_show_form(
             step_id="configure_room",
@@ -409,16 +563,24 @@ class ChauffageIntelligentConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return ChauffageIntelligentOptionsFlow(config_entry)
 
 
-class ChauffageIntelligentOptionsFlow(config_entries.OptionsFlow):
+class ChauffageIntelligentOptionsFlow(_RegistryLookupMixin, config_entries.OptionsFlow):
     """Handle options flow for Chauffage Intelligent."""
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         # Note: self.config_entry is provided by the parent class in newer HA versions
-        self._data: dict[str, Any] = dict(config_entry.data)
+        # Copy the rooms mapping too, room edits must not touch the entry data
+        data = config_entry.data
+        self._data: dict[str, Any] = {**data, CONF_PIECES: dict(data.get(CONF_PIECES, {}))}
         self._selected_room: str | None = None
         self._current_area_id: str | None = None
         self._current_area_name: str | None = None
+        self._registry_cache = {}
+
+    @callback
+    def _async_update_entry(self) -> None:
+        """Store the new data, the entry update listener applies or reloads it."""
+        self.hass.config_entries.async_update_entry(self.config_entry, data=self._data)
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -437,21 +599,7 @@ class ChauffageIntelligentOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("action"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                {"value": "add_room", "label": "Ajouter une pièce"},
-                                {"value": "modify_room", "label": "Modifier une pièce"},
-                                {"value": "delete_room", "label": "Supprimer une pièce"},
-                                {"value": "modify_settings", "label": "Modifier les paramètres"},
-                            ],
-                            mode=selector.SelectSelectorMode.LIST,
-                        ),
-                    ),
-                }
-            ),
+            data_schema=_INIT_MENU_SCHEMA,
         )
 
     async def async_step_select_area(
@@ -459,6 +607,7 @@ class ChauffageIntelligentOptionsFlow(config_entries.OptionsFlow):
     ) -> config_entries.FlowResult:
         """Handle area selection for adding a new room."""
         errors = {}
+        pieces = self._data.get(CONF_PIECES) or {}
 
         if user_input is not None:
             area_id = user_input["area"]
@@ -466,7 +615,7 @@ class ChauffageIntelligentOptionsFlow(config_entries.OptionsFlow):
             area = area_reg.async_get_area(area_id)
 
             if area:
-                if area_id in self._data.get(CONF_PIECES, {}):
+                if area_id in pieces:
                     errors["base"] = "area_already_configured"
                 else:
                     self._current_area_id = area_id
@@ -474,21 +623,14 @@ class ChauffageIntelligentOptionsFlow(config_entries.OptionsFlow):
                     return await self.async_step_add_room()
 
         # Get areas with climate entities, excluding already configured ones
-        area_options = _get_areas_with_climate(self.hass)
-        configured_areas = set(self._data.get(CONF_PIECES, {}).keys())
-        area_options = [a for a in area_options if a["value"] not in configured_areas]
+        area_options = [a for a in self._areas_with_climate() if a["value"] not in pieces]
 
         if not area_options:
             return self.async_abort(reason="no_areas_available")
 
         data_schema = vol.Schema(
             {
-                vol.Required("area"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=area_options,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
+                vol.Required("area"): _dropdown(area_options),
             }
         )
 
@@ -505,81 +647,22 @@ class ChauffageIntelligentOptionsFlow(config_entries.OptionsFlow):
         errors = {}
 
         if user_input is not None:
-            piece_type = user_input[CONF_PIECE_TYPE]
-            radiateurs = user_input[CONF_PIECE_RADIATEURS]
-
-            if isinstance(radiateurs, str):
-                radiateurs = [radiateurs]
-
-            if CONF_PIECES not in self._data:
-                self._data[CONF_PIECES] = {}
-
-            self._data[CONF_PIECES][self._current_area_id] = {
-                CONF_PIECE_NAME: self._current_area_name,
-                CONF_PIECE_AREA_ID: self._current_area_id,
-                CONF_PIECE_TYPE: piece_type,
-                CONF_PIECE_RADIATEURS: radiateurs,
-                CONF_PIECE_SONDE: user_input.get(CONF_PIECE_SONDE),
-                CONF_PIECE_TEMPERATURES: {
-                    MODE_CONFORT: user_input.get(
-                        "temp_confort",
-                        DEFAULT_TEMPERATURES[piece_type][MODE_CONFORT],
-                    ),
-                    MODE_ECO: user_input.get(
-                        "temp_eco",
-                        DEFAULT_TEMPERATURES[piece_type][MODE_ECO],
-                    ),
-                    MODE_HORS_GEL: user_input.get(
-                        "temp_hors_gel",
-                        DEFAULT_TEMPERATURES[piece_type][MODE_HORS_GEL],
-                    ),
-                },
-            }
+            self._data.setdefault(CONF_PIECES, {})[self._current_area_id] = _build_room_dict(
+                self._current_area_name, self._current_area_id, user_input
+            )
 
             # Update the config entry
-            self.hass.config_entries.async_update_entry(self.config_entry, data=self._data)
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+            self._async_update_entry()
 
             return self.async_create_entry(title="", data={})
 
         # Get climate entities for this area
-        climate_entities = _get_climate_entities_for_area(self.hass, self._current_area_id or "")
+        climate_entities = self._climate_entities_for_area(self._current_area_id or "")
 
         # Get temperature sensors for this area
-        temp_sensors = _get_temperature_sensors_for_area(self.hass, self._current_area_id or "")
+        temp_sensors = self._temperature_sensors_for_area(self._current_area_id or "")
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_PIECE_TYPE): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=ROOM_TYPES,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Required(CONF_PIECE_RADIATEURS): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=climate_entities,
-                        multiple=True,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Optional(CONF_PIECE_SONDE): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=temp_sensors,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Optional("temp_confort", default=19): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=15, max=25, unit_of_measurement="°C"),
-                ),
-                vol.Optional("temp_eco", default=17): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=12, max=20, unit_of_measurement="°C"),
-                ),
-                vol.Optional("temp_hors_gel", default=7): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=5, max=12, unit_of_measurement="°C"),
-                ),
-            }
-        )
+        data_schema = _build_room_schema(climate_entities, temp_sensors)
 
         return self.async_show_form(
             step_id="add_room",
@@ -601,21 +684,13 @@ class ChauffageIntelligentOptionsFlow(config_entries.OptionsFlow):
             self._selected_room = user_input["room"]
             return await self.async_step_modify_room()
 
-        room_options = [
-            {"value": room_id, "label": room_config.get(CONF_PIECE_NAME, room_id)}
-            for room_id, room_config in pieces.items()
-        ]
+        room_options = _build_room_options(pieces)
 
         return self.async_show_form(
             step_id="select_room",
             data_schema=vol.Schema(
                 {
-                    vol.Required("room"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=room_options,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        ),
-                    ),
+                    vol.Required("room"): _dropdown(room_options),
                 }
             ),
         )
@@ -627,110 +702,51 @@ class ChauffageIntelligentOptionsFlow(config_entries.OptionsFlow):
         if self._selected_room is None:
             return await self.async_step_select_room()
 
-        room_config = self._data[CONF_PIECES].get(self._selected_room, {})
+        pieces = self._data[CONF_PIECES]
+        room_config = pieces.get(self._selected_room, {})
         temps = room_config.get(CONF_PIECE_TEMPERATURES, {})
 
         if user_input is not None:
-            piece_type = user_input[CONF_PIECE_TYPE]
-            radiateurs = user_input[CONF_PIECE_RADIATEURS]
-
-            if isinstance(radiateurs, str):
-                radiateurs = [radiateurs]
-
             # Update the room
-            self._data[CONF_PIECES][self._selected_room] = {
-                CONF_PIECE_NAME: room_config.get(CONF_PIECE_NAME),
-                CONF_PIECE_AREA_ID: room_config.get(CONF_PIECE_AREA_ID, self._selected_room),
-                CONF_PIECE_TYPE: piece_type,
-                CONF_PIECE_RADIATEURS: radiateurs,
-                CONF_PIECE_SONDE: user_input.get(CONF_PIECE_SONDE),
-                CONF_PIECE_TEMPERATURES: {
-                    MODE_CONFORT: user_input.get("temp_confort", 19),
-                    MODE_ECO: user_input.get("temp_eco", 17),
-                    MODE_HORS_GEL: user_input.get("temp_hors_gel", 7),
-                },
-            }
+            pieces[self._selected_room] = _build_room_dict(
+                room_config.get(CONF_PIECE_NAME),
+                room_config.get(CONF_PIECE_AREA_ID, self._selected_room),
+                user_input,
+            )
 
             # Update the config entry
-            self.hass.config_entries.async_update_entry(self.config_entry, data=self._data)
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+            self._async_update_entry()
 
             return self.async_create_entry(title="", data={})
 
         # Get climate entities for this area
         area_id = room_config.get(CONF_PIECE_AREA_ID, self._selected_room) or ""
-        climate_entities = _get_climate_entities_for_area(self.hass, area_id)
+        climate_entities = self._climate_entities_for_area(area_id)
 
         # If no entities found in area, fall back to all climate entities
         if not climate_entities:
-            climate_entities = [state.entity_id for state in self.hass.states.async_all("climate")]
+            climate_entities = self._entity_ids("climate")
 
         # Get temperature sensors for this area
-        temp_sensors = _get_temperature_sensors_for_area(self.hass, area_id)
+        temp_sensors = self._temperature_sensors_for_area(area_id)
 
         # If no sensors found in area, fall back to all temperature sensors
         if not temp_sensors:
-            temp_sensors = [
-                state.entity_id
-                for state in self.hass.states.async_all("sensor")
-                if state.attributes.get("device_class") == "temperature"
-            ]
+            temp_sensors = self._all_temperature_sensors()
 
         # Get current radiateurs (handle both old single format and new list format)
-        current_radiateurs = room_config.get(CONF_PIECE_RADIATEURS, [])
-        if isinstance(current_radiateurs, str):
-            current_radiateurs = [current_radiateurs]
+        current_radiateurs = as_radiator_list(room_config.get(CONF_PIECE_RADIATEURS))
 
         # Pre-fill with current values
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_PIECE_TYPE,
-                    default=room_config.get(CONF_PIECE_TYPE, "autre"),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=ROOM_TYPES,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Required(
-                    CONF_PIECE_RADIATEURS,
-                    default=current_radiateurs,
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=climate_entities,
-                        multiple=True,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Optional(
-                    CONF_PIECE_SONDE,
-                    default=room_config.get(CONF_PIECE_SONDE, ""),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=temp_sensors,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Optional(
-                    "temp_confort",
-                    default=temps.get(MODE_CONFORT, 19),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=15, max=25, unit_of_measurement="°C"),
-                ),
-                vol.Optional(
-                    "temp_eco",
-                    default=temps.get(MODE_ECO, 17),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=12, max=20, unit_of_measurement="°C"),
-                ),
-                vol.Optional(
-                    "temp_hors_gel",
-                    default=temps.get(MODE_HORS_GEL, 7),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=5, max=12, unit_of_measurement="°C"),
-                ),
-            }
+        data_schema = _build_room_schema(
+            climate_entities,
+            temp_sensors,
+            piece_type=room_config.get(CONF_PIECE_TYPE, "autre"),
+            radiateurs=current_radiateurs,
+            sonde=room_config.get(CONF_PIECE_SONDE, ""),
+            temp_confort=temps.get(MODE_CONFORT, 19),
+            temp_eco=temps.get(MODE_ECO, 17),
+            temp_hors_gel=temps.get(MODE_HORS_GEL, 7),
         )
 
         return self.async_show_form(
@@ -754,34 +770,24 @@ class ChauffageIntelligentOptionsFlow(config_entries.OptionsFlow):
             room_to_delete = user_input["room"]
 
             if user_input.get("confirm"):
-                # Delete the room
-                del self._data[CONF_PIECES][room_to_delete]
-
-                # Update the config entry
-                self.hass.config_entries.async_update_entry(self.config_entry, data=self._data)
-                await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+                # Delete the room, a stale submission may target one already removed
+                if pieces.pop(room_to_delete, None) is not None:
+                    # Update the config entry
+                    self._async_update_entry()
 
                 return self.async_create_entry(title="", data={})
             else:
                 # User cancelled
                 return await self.async_step_init()
 
-        room_options = [
-            {"value": room_id, "label": room_config.get(CONF_PIECE_NAME, room_id)}
-            for room_id, room_config in pieces.items()
-        ]
+        room_options = _build_room_options(pieces)
 
         return self.async_show_form(
             step_id="delete_room",
             data_schema=vol.Schema(
                 {
-                    vol.Required("room"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=room_options,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        ),
-                    ),
-                    vol.Required("confirm", default=False): selector.BooleanSelector(),
+                    vol.Required("room"): _dropdown(room_options),
+                    vol.Required("confirm", default=False): _CONFIRM_SELECTOR,
                 }
             ),
         )
@@ -790,74 +796,38 @@ class ChauffageIntelligentOptionsFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.FlowResult:
         """Handle modifying global settings."""
+        data = self._data
+
         if user_input is not None:
             # Update settings
-            self._data[CONF_CALENDAR] = user_input[CONF_CALENDAR]
-            self._data[CONF_PRESENCE_TRACKERS] = user_input[CONF_PRESENCE_TRACKERS]
-            self._data[CONF_UPDATE_INTERVAL] = (
-                user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL // 60) * 60
-            )
-            self._data[CONF_SECURITY_FACTOR] = user_input.get(
-                CONF_SECURITY_FACTOR, DEFAULT_SECURITY_FACTOR
-            )
-            self._data[CONF_MIN_PREHEAT_TIME] = user_input.get(
-                CONF_MIN_PREHEAT_TIME, DEFAULT_MIN_PREHEAT_TIME
+            get_input = user_input.get
+            data[CONF_CALENDAR] = user_input[CONF_CALENDAR]
+            data[CONF_PRESENCE_TRACKERS] = user_input[CONF_PRESENCE_TRACKERS]
+            data[CONF_UPDATE_INTERVAL] = _minutes_to_seconds(
+                get_input(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL_MINUTES)
             )
+            data[CONF_SECURITY_FACTOR] = get_input(CONF_SECURITY_FACTOR, DEFAULT_SECURITY_FACTOR)
+            data[CONF_MIN_PREHEAT_TIME] = get_input(CONF_MIN_PREHEAT_TIME, DEFAULT_MIN_PREHEAT_TIME)
 
             # Update the config entry
-            self.hass.config_entries.async_update_entry(self.config_entry, data=self._data)
-            await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+            self._async_update_entry()
 
             return self.async_create_entry(title="", data={})
 
         # Get available calendars
-        calendars = [state.entity_id for state in self.hass.states.async_all("calendar")]
+        calendars = self._entity_ids("calendar")
 
         # Get available device trackers
-        trackers = [state.entity_id for state in self.hass.states.async_all("device_tracker")]
-
-        current_interval = self._data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_CALENDAR,
-                    default=self._data.get(CONF_CALENDAR, ""),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=calendars,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Required(
-                    CONF_PRESENCE_TRACKERS,
-                    default=self._data.get(CONF_PRESENCE_TRACKERS, []),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=trackers,
-                        multiple=True,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    ),
-                ),
-                vol.Optional(
-                    CONF_UPDATE_INTERVAL,
-                    default=current_interval // 60,
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=1, max=60, unit_of_measurement="min"),
-                ),
-                vol.Optional(
-                    CONF_SECURITY_FACTOR,
-                    default=self._data.get(CONF_SECURITY_FACTOR, DEFAULT_SECURITY_FACTOR),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=1.0, max=2.0, step=0.1),
-                ),
-                vol.Optional(
-                    CONF_MIN_PREHEAT_TIME,
-                    default=self._data.get(CONF_MIN_PREHEAT_TIME, DEFAULT_MIN_PREHEAT_TIME),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=10, max=120, unit_of_measurement="min"),
-                ),
-            }
+        trackers = self._entity_ids("device_tracker")
+
+        data_schema = _build_settings_schema(
+            calendars,
+            trackers,
+            calendar=data.get(CONF_CALENDAR, ""),
+            presence_trackers=data.get(CONF_PRESENCE_TRACKERS, []),
+            update_interval=data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL) // 60,
+            security_factor=data.get(CONF_SECURITY_FACTOR, DEFAULT_SECURITY_FACTOR),
+            min_preheat_time=data.get(CONF_MIN_PREHEAT_TIME, DEFAULT_MIN_PREHEAT_TIME),
         )
 
         return self.async_show_form(
@@ -1,5 +1,7 @@
 """Constants for Chauffage Intelligent integration."""
 
+from types import MappingProxyType
+
 DOMAIN = "chauffage_intelligent"
 
 # Modes
@@ -23,27 +25,33 @@ SELECT_OPTION_LABELS = {
 }
 
 # Room types
-ROOM_TYPES = [
+ROOM_TYPES = (
     "salon",
     "chambre",
     "chambre_enfant",
     "bureau",
     "salle_de_bain",
     "autre",
-]
+)
 
-# Default temperatures by room type
-DEFAULT_TEMPERATURES = {
-    "salon": {MODE_CONFORT: 20, MODE_ECO: 17, MODE_HORS_GEL: 7},
-    "chambre": {MODE_CONFORT: 18, MODE_ECO: 16, MODE_HORS_GEL: 7},
-    "chambre_enfant": {MODE_CONFORT: 19, MODE_ECO: 17, MODE_HORS_GEL: 7},
-    "bureau": {MODE_CONFORT: 19, MODE_ECO: 17, MODE_HORS_GEL: 7},
-    "salle_de_bain": {MODE_CONFORT: 22, MODE_ECO: 17, MODE_HORS_GEL: 7},
-    "autre": {MODE_CONFORT: 19, MODE_ECO: 17, MODE_HORS_GEL: 7},
-}
+# Default temperatures by room type (read-only)
+DEFAULT_TEMPERATURES = MappingProxyType(
+    {
+        room_type: MappingProxyType(temperatures)
+        for room_type, temperatures in {
+            "salon": {MODE_CONFORT: 20, MODE_ECO: 17, MODE_HORS_GEL: 7},
+            "chambre": {MODE_CONFORT: 18, MODE_ECO: 16, MODE_HORS_GEL: 7},
+            "chambre_enfant": {MODE_CONFORT: 19, MODE_ECO: 17, MODE_HORS_GEL: 7},
+            "bureau": {MODE_CONFORT: 19, MODE_ECO: 17, MODE_HORS_GEL: 7},
+            "salle_de_bain": {MODE_CONFORT: 22, MODE_ECO: 17, MODE_HORS_GEL: 7},
+            "autre": {MODE_CONFORT: 19, MODE_ECO: 17, MODE_HORS_GEL: 7},
+        }.items()
+    }
+)
 
 # Default parameters
 DEFAULT_UPDATE_INTERVAL = 300  # 5 minutes in seconds
+DEFAULT_UPDATE_INTERVAL_MINUTES = DEFAULT_UPDATE_INTERVAL // 60  # As shown in the forms
 DEFAULT_SECURITY_FACTOR = 1.3
 DEFAULT_MIN_PREHEAT_TIME = 30  # minutes
 DEFAULT_DERIVATIVE_WINDOW = 30  # minutes
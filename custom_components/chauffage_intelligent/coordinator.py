@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import STORAGE_DIR, Store, async_migrator
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
@@ -23,6 +26,7 @@ from .const import (
     CONF_PIECES,
     CONF_PRESENCE_TRACKERS,
     CONF_SECURITY_FACTOR,
+    CONF_UPDATE_INTERVAL,
     DEFAULT_HEATING_RATE,
     DOMAIN,
     EVENT_ABSENCE,
@@ -45,37 +49,162 @@ LEARNING_MIN_SAMPLES = 5  # Minimum samples before using learned rate
 LEARNING_MAX_SAMPLES = 100  # Maximum samples to keep per condition
 LEARNING_RATE_MIN = 0.3  # Minimum valid heating rate °C/h
 LEARNING_RATE_MAX = 5.0  # Maximum valid heating rate °C/h
+LEARNING_SAVE_DELAY = 30  # Seconds to batch observations into a single write
+LEARNING_STORAGE_VERSION = 1
+LEARNING_STORAGE_KEY = f"{DOMAIN}_learned_rates"
+# Raw JSON file used before the learned data moved to a Store
+LEGACY_LEARNING_FILE = f"{DOMAIN}_learned_rates.json"
+
+# Minimum delay in seconds between two requested refreshes
+REQUEST_REFRESH_COOLDOWN = 10
+
+# Summary prefix of room-specific comfort events, e.g. "confort salon"
+_CONFORT_PREFIX = f"{EVENT_CONFORT} "
+_CONFORT_PREFIX_LEN = len(_CONFORT_PREFIX)
+
+# Maximum age of the fetched calendar events while the calendar state is unchanged,
+# in update intervals, so scheduled refreshes reuse them
+CALENDAR_CACHE_INTERVALS = 6
+
+# Learning statistics reported for rooms without enabled entities
+_NO_LEARNING_STATS = MappingProxyType({"samples": None, "avg_rate": None})
+
+# Common weather entity patterns providing the outdoor temperature, in order
+OUTDOOR_TEMPERATURE_ENTITIES = (
+    "weather.home",
+    "weather.maison",
+    "sensor.outdoor_temperature",
+    "sensor.temperature_exterieure",
+)
+
+
+def as_radiator_list(radiateurs: str | list[str] | None) -> list[str]:
+    """Return the radiators of a room as a list, accepting the legacy single entity."""
+    if isinstance(radiateurs, str):
+        return [radiateurs]
+    return list(radiateurs) if radiateurs is not None else []
+
+
+def _normalize_pieces(pieces: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Return a copy of the rooms configuration with radiators as lists."""
+    # Normalize the legacy single radiator format once
+    return {
+        piece_id: {
+            **piece_config,
+            CONF_PIECE_RADIATEURS: as_radiator_list(piece_config.get(CONF_PIECE_RADIATEURS)),
+        }
+        for piece_id, piece_config in pieces.items()
+    }
+
+
+# Time period of each hour: night (22-6), morning (6-12), afternoon (12-18), evening (18-22)
+_PERIOD_OF_HOUR = (0,) * 6 + (1,) * 6 + (2,) * 6 + (3,) * 4 + (0,) * 2
+
+
+def _time_period(hour: int) -> int:
+    """Return the time period of an hour."""
+    return _PERIOD_OF_HOUR[hour % 24]
+
+
+def _read_outdoor_temperature(entity_id: str, state: State | None) -> float | None:
+    """Read the outdoor temperature from a weather or sensor state."""
+    if not state:
+        return None
+
+    # Weather entities have temperature in attributes
+    if entity_id.startswith("weather."):
+        temp = state.attributes.get("temperature")
+        if temp is None:
+            return None
+    # Sensor entities have temperature in state
+    elif state.state in ("unknown", "unavailable"):
+        return None
+    else:
+        temp = state.state
+
+    try:
+        return float(temp)
+    except ValueError:
+        return None
+
+
+class _CalendarEvent(NamedTuple):
+    """Calendar event with its dates parsed and its summary normalized once."""
+
+    start: datetime
+    end: datetime | None
+    summary: str
+    event: dict[str, Any]
+
+
+def _parse_event_datetime(value: Any) -> datetime | None:
+    """Parse a calendar event date, accepting an already parsed datetime."""
+    return dt_util.parse_datetime(value) if isinstance(value, str) else value
+
+
+def _normalize_events(events: list[dict[str, Any]]) -> list[_CalendarEvent]:
+    """Parse every calendar event once for all the rooms."""
+    normalized = []
+    for event in events:
+        # Events without a usable start never apply to any room
+        if (start := _parse_event_datetime(event.get("start"))) is None:
+            continue
+        summary = event.get("summary", "").lower().strip()
+        normalized.append(
+            _CalendarEvent(
+                start,
+                _parse_event_datetime(event.get("end")),
+                # Normalize separators: support "confort - salon" and "confort salon"
+                summary.replace(" - ", " "),
+                event,
+            )
+        )
+    return normalized
 
 
 class HeatingRateLearner:
     """Learn and predict heating rates based on historical data."""
 
-    def __init__(self, hass: HomeAssistant, storage_path: Path) -> None:
+    def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the learner."""
         self.hass = hass
-        self.storage_path = storage_path
-        self._data: dict[str, list[dict[str, Any]]] = {}
-        self._load_data()
-
-    def _load_data(self) -> None:
-        """Load learned data from storage."""
+        # The store serializes writes and does the final write when HA stops
+        self._store: Store[dict[str, list[dict[str, Any]]]] = Store(
+            hass, LEARNING_STORAGE_VERSION, LEARNING_STORAGE_KEY
+        )
+        # Bounded sample history per room, the oldest samples drop out first
+        self._data: dict[str, deque[dict[str, Any]]] = {}
+        # Statistics per room, computed on demand until the next observation
+        self._stats: dict[str, dict[str, Any]] = {}
+        self.loaded = False
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load learned data from storage, migrating the former raw JSON file."""
+        legacy_path = self.hass.config.path(STORAGE_DIR, LEGACY_LEARNING_FILE)
         try:
-            if self.storage_path.exists():
-                with open(self.storage_path) as f:
-                    self._data = json.load(f)
-                _LOGGER.debug("Loaded heating rate data: %d rooms", len(self._data))
+            data = await async_migrator(self.hass, legacy_path, self._store)
         except Exception as err:
             _LOGGER.warning("Failed to load heating rate data: %s", err)
-            self._data = {}
+            data = None
 
-    def _save_data(self) -> None:
-        """Save learned data to storage."""
-        try:
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.storage_path, "w") as f:
-                json.dump(self._data, f)
-        except Exception as err:
-            _LOGGER.warning("Failed to save heating rate data: %s", err)
+        self._data = {
+            piece_id: deque(samples, maxlen=LEARNING_MAX_SAMPLES)
+            for piece_id, samples in (data or {}).items()
+        }
+        self._stats = {}
+        self.loaded = True
+        _LOGGER.debug("Loaded heating rate data: %d rooms", len(self._data))
+
+    def _data_to_save(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the learned data to store, each sample history as a list."""
+        self._save_pending = False
+        return {piece_id: list(samples) for piece_id, samples in self._data.items()}
+
+    async def async_flush(self) -> None:
+        """Write pending observations immediately, used on shutdown."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
 
     def record_observation(
         self,
@@ -83,6 +212,8 @@ class HeatingRateLearner:
         heating_rate: float,
         outdoor_temp: float | None = None,
         hour: int | None = None,
+        *,
+        now: datetime | None = None,
     ) -> None:
         """Record a heating rate observation."""
         # Validate heating rate
@@ -92,26 +223,28 @@ class HeatingRateLearner:
         if heating_rate > LEARNING_RATE_MAX:
             return  # Ignore unrealistic values
 
+        if now is None:
+            now = dt_util.now()
         if hour is None:
-            hour = dt_util.now().hour
+            hour = now.hour
 
         observation = {
             "rate": round(heating_rate, 3),
             "outdoor_temp": outdoor_temp,
             "hour": hour,
-            "timestamp": dt_util.now().isoformat(),
+            # Compact epoch seconds, older samples keep their ISO "timestamp"
+            "ts": int(now.timestamp()),
         }
 
-        if piece_id not in self._data:
-            self._data[piece_id] = []
-
-        self._data[piece_id].append(observation)
+        if (samples := self._data.get(piece_id)) is None:
+            samples = self._data[piece_id] = deque(maxlen=LEARNING_MAX_SAMPLES)
 
-        # Keep only the last N samples
-        if len(self._data[piece_id]) > LEARNING_MAX_SAMPLES:
-            self._data[piece_id] = self._data[piece_id][-LEARNING_MAX_SAMPLES:]
+        # The bounded deque keeps only the last N samples
+        samples.append(observation)
+        self._stats.pop(piece_id, None)
 
-        self._save_data()
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, LEARNING_SAVE_DELAY)
         _LOGGER.debug(
             "Recorded heating rate for %s: %.2f°C/h (outdoor: %s, hour: %d)",
             piece_id,
@@ -138,17 +271,15 @@ class HeatingRateLearner:
             hour = dt_util.now().hour
 
         # Weight samples by similarity to current conditions
+        period_of_hour = _PERIOD_OF_HOUR
+        current_period = _time_period(hour)
         weighted_sum = 0.0
         weight_total = 0.0
 
         for sample in samples:
-            weight = 1.0
-
             # Time-of-day similarity (day vs night)
-            sample_hour = sample.get("hour", 12)
-            is_same_period = self._same_time_period(hour, sample_hour)
-            if is_same_period:
-                weight *= 1.5
+            sample_period = period_of_hour[sample.get("hour", 12) % 24]
+            weight = 1.5 if sample_period == current_period else 1.0
 
             # Outdoor temperature similarity
             sample_outdoor = sample.get("outdoor_temp")
@@ -156,9 +287,7 @@ class HeatingRateLearner:
                 temp_diff = abs(outdoor_temp - sample_outdoor)
                 if temp_diff <= 5:
                     weight *= 1.5
-                elif temp_diff <= 10:
-                    weight *= 1.0
-                else:
+                elif temp_diff > 10:
                     weight *= 0.5
 
             weighted_sum += sample["rate"] * weight
@@ -178,19 +307,7 @@ class HeatingRateLearner:
 
     def _same_time_period(self, hour1: int, hour2: int) -> bool:
         """Check if two hours are in the same time period."""
-
-        # Define periods: night (22-6), morning (6-12), afternoon (12-18), evening (18-22)
-        def get_period(h: int) -> int:
-            if 6 <= h < 12:
-                return 1
-            elif 12 <= h < 18:
-                return 2
-            elif 18 <= h < 22:
-                return 3
-            else:
-                return 0
-
-        return get_period(hour1) == get_period(hour2)
+        return _time_period(hour1) == _time_period(hour2)
 
     def get_stats(self, piece_id: str) -> dict[str, Any]:
         """Get learning statistics for a room."""
@@ -201,13 +318,18 @@ class HeatingRateLearner:
         if not samples:
             return {"samples": 0, "avg_rate": None, "min_rate": None, "max_rate": None}
 
+        # Samples only change in record_observation, which drops the cached stats
+        if (stats := self._stats.get(piece_id)) is not None:
+            return stats
+
         rates = [s["rate"] for s in samples]
-        return {
+        stats = self._stats[piece_id] = {
             "samples": len(samples),
             "avg_rate": round(sum(rates) / len(rates), 2),
             "min_rate": round(min(rates), 2),
             "max_rate": round(max(rates), 2),
         }
+        return stats
 
 
 class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
@@ -225,34 +347,109 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=update_interval,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=True
+            ),
         )
 
         self.calendar_entity = config[CONF_CALENDAR]
         self.presence_trackers = config[CONF_PRESENCE_TRACKERS]
-        self.pieces = config[CONF_PIECES]
+        self.pieces = _normalize_pieces(config[CONF_PIECES])
+        # Lowercased room name and id matched against calendar event summaries
+        self._piece_names = {
+            piece_id: (piece_config.get(CONF_PIECE_NAME, piece_id).lower(), piece_id.lower())
+            for piece_id, piece_config in self.pieces.items()
+        }
+        # Room comfort event summaries mapped to the rooms they apply to
+        self._comfort_summaries: dict[str, list[str]] = {}
+        for piece_id, names in self._piece_names.items():
+            for name in set(names):
+                self._comfort_summaries.setdefault(_CONFORT_PREFIX + name, []).append(piece_id)
         self.security_factor = config[CONF_SECURITY_FACTOR]
         self.min_preheat_time = config[CONF_MIN_PREHEAT_TIME]
         self.derivative_window = config[CONF_DERIVATIVE_WINDOW]
 
         # Temperature history for derivative calculation
-        self._temp_history: dict[str, list[tuple[datetime, float]]] = {}
+        self._temp_history: dict[str, deque[tuple[datetime, float]]] = {}
+
+        # Last calendar fetch: (fetch time, calendar state last_updated, normalized events)
+        self._calendar_cache: tuple[datetime, Any, list[_CalendarEvent]] | None = None
 
         # Manual mode overrides: {piece_id: (mode, expiry_datetime or None)}
         self._mode_overrides: dict[str, tuple[str, datetime | None]] = {}
 
         # Heating rate learner
-        storage_path = Path(hass.config.path(".storage")) / f"{DOMAIN}_learned_rates.json"
-        self._learner = HeatingRateLearner(hass, storage_path)
+        self._learner = HeatingRateLearner(hass)
+
+        # Entity that provided the outdoor temperature on the last update
+        self._outdoor_entity: str | None = None
 
         # Track previous mode to detect heating periods
         self._previous_modes: dict[str, str] = {}
 
+        # Number of enabled entities per room: {piece_id: count}
+        self._active_pieces: dict[str, int] = {}
+
+    @callback
+    def async_register_active_piece(self, piece_id: str) -> CALLBACK_TYPE:
+        """Mark a room as having an enabled entity, return the unregister callback."""
+        self._active_pieces[piece_id] = self._active_pieces.get(piece_id, 0) + 1
+
+        @callback
+        def _unregister() -> None:
+            count = self._active_pieces.get(piece_id, 0) - 1
+            if count > 0:
+                self._active_pieces[piece_id] = count
+            else:
+                self._active_pieces.pop(piece_id, None)
+
+        return _unregister
+
+    @callback
+    def async_update_settings(self, config: dict[str, Any]) -> bool:
+        """Apply tunable settings in place, return False when a reload is needed."""
+        # Rooms and sources define the entities, changing them needs a reload
+        if (
+            config[CONF_CALENDAR] != self.calendar_entity
+            or config[CONF_PRESENCE_TRACKERS] != self.presence_trackers
+            or _normalize_pieces(config[CONF_PIECES]) != self.pieces
+        ):
+            return False
+
+        self.security_factor = config[CONF_SECURITY_FACTOR]
+        self.min_preheat_time = config[CONF_MIN_PREHEAT_TIME]
+        self.derivative_window = config[CONF_DERIVATIVE_WINDOW]
+        self.update_interval = timedelta(seconds=config[CONF_UPDATE_INTERVAL])
+        return True
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled refreshes and write pending learned data."""
+        await super().async_shutdown()
+        await self._learner.async_flush()
+
+    def piece_data(self, piece_id: str) -> dict[str, Any] | None:
+        """Return the computed data of a room, or None when not available."""
+        data = self.data
+        return data["pieces"].get(piece_id) if data else None
+
+    def _is_piece_active(self, piece_id: str) -> bool:
+        """Return whether a room has enabled entities showing its derived values."""
+        # Until entities are added (first refresh), every room is active
+        return not self._active_pieces or piece_id in self._active_pieces
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from sources and compute states."""
+        # Learned rates are read from disk in the executor on the first refresh
+        if not self._learner.loaded:
+            await self._learner.async_load()
+
         try:
+            # Every step of this update works from the same current time
+            now = dt_util.now()
+
             # 1. Get calendar events
-            calendar_events = await self._get_calendar_events()
-            parsed_events = self._parse_calendar_events(calendar_events)
+            calendar_events = await self._get_calendar_events(now=now)
+            parsed_events = self._parse_calendar_events(calendar_events, now=now)
 
             # 2. Compute presence
             maison_occupee = self._compute_presence()
@@ -260,29 +457,48 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
             # 3. Get outdoor temperature if available
             outdoor_temp = self._get_outdoor_temperature()
 
+            # Absence and presence apply to every room, resolve them once
+            global_mode = self._resolve_global(parsed_events, maison_occupee)
+
+            # Next comfort event of each room, found in one pass over the events
+            next_comfort_events = self._find_next_comfort_events(calendar_events, now=now)
+
             # 4. Process each room
             pieces_data = {}
+            radiator_writes: list[tuple[list[str], float]] = []
             for piece_id, piece_config in self.pieces.items():
+                # Resolve mode
+                mode, source = (
+                    self._active_override(piece_id, now=now)
+                    or global_mode
+                    or self._resolve_room_specific(piece_id, parsed_events)
+                )
+
+                # Get target temperature
+                consigne = piece_config[CONF_PIECE_TEMPERATURES].get(mode, 19)
+
+                # Rooms without enabled entities are heated and preheated the
+                # same way, only their measured rate and learning are skipped
+                active = self._is_piece_active(piece_id)
+
                 # Get current temperature
                 temp_actuelle = self._get_temperature(piece_config)
 
                 # Compute heating rate (measured)
-                vitesse_mesuree = self._compute_derivative(piece_id, temp_actuelle)
+                vitesse_mesuree = (
+                    self._compute_derivative(piece_id, temp_actuelle, now=now) if active else None
+                )
 
                 # Get learned rate for better predictions
-                vitesse_apprise = self._learner.get_predicted_rate(piece_id, outdoor_temp)
+                vitesse_apprise = self._learner.get_predicted_rate(
+                    piece_id, outdoor_temp, now.hour
+                )
 
                 # Use learned rate if available and measured is None
                 vitesse = vitesse_mesuree
                 if vitesse is None and vitesse_apprise is not None:
                     vitesse = vitesse_apprise
 
-                # Resolve mode
-                mode, source = self._resolve_mode(piece_id, parsed_events, maison_occupee)
-
-                # Get target temperature
-                consigne = piece_config[CONF_PIECE_TEMPERATURES].get(mode, 19)
-
                 # Compute preheat time using best available rate
                 vitesse_pour_calcul = vitesse
                 if vitesse_pour_calcul is None and vitesse_apprise is not None:
@@ -293,10 +509,10 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
                 )
 
                 # Find next comfort event for this room
-                prochain_evenement = self._find_next_comfort_event(piece_id, calendar_events)
+                prochain_evenement = next_comfort_events.get(piece_id)
                 prochain_evenement_iso = None
                 if prochain_evenement:
-                    start = prochain_evenement.get("start")
+                    start = prochain_evenement.event.get("start")
                     if isinstance(start, str):
                         prochain_evenement_iso = start
                     elif isinstance(start, datetime):
@@ -304,7 +520,7 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
 
                 # Check if preheating should be triggered
                 prechauffage_actif = self._check_preheat_trigger(
-                    piece_id, calendar_events, temps_prechauffe
+                    prochain_evenement, temps_prechauffe, now=now
                 )
 
                 # If preheating triggered and currently in eco, switch to comfort
@@ -314,17 +530,18 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
                     source = SOURCE_ANTICIPATION
 
                 # Learn from heating periods
-                self._learn_heating_rate(piece_id, mode, vitesse_mesuree, outdoor_temp)
+                if active:
+                    self._learn_heating_rate(
+                        piece_id, mode, vitesse_mesuree, outdoor_temp, now=now
+                    )
 
-                # Apply temperature to radiators (supports multiple)
-                radiateurs = piece_config.get(CONF_PIECE_RADIATEURS, [])
-                # Handle legacy single radiator config
-                if isinstance(radiateurs, str):
-                    radiateurs = [radiateurs]
-                await self._set_radiators_temperature(radiateurs, consigne)
+                # Apply temperature to radiators (supports multiple) after the loop
+                radiator_writes.append((piece_config[CONF_PIECE_RADIATEURS], consigne))
 
                 # Get learning stats
-                learning_stats = self._learner.get_stats(piece_id)
+                learning_stats = (
+                    self._learner.get_stats(piece_id) if active else _NO_LEARNING_STATS
+                )
 
                 pieces_data[piece_id] = {
                     "mode": mode,
@@ -343,6 +560,14 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
                 # Update previous mode
                 self._previous_modes[piece_id] = mode
 
+            # Write every room's radiators concurrently
+            await asyncio.gather(
+                *(
+                    self._set_radiators_temperature(radiators, temperature)
+                    for radiators, temperature in radiator_writes
+                )
+            )
+
             return {
                 "maison_occupee": maison_occupee,
                 "outdoor_temp": outdoor_temp,
@@ -358,6 +583,8 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
         current_mode: str,
         heating_rate: float | None,
         outdoor_temp: float | None,
+        *,
+        now: datetime | None = None,
     ) -> None:
         """Learn from heating periods."""
         # Only learn when actively heating (comfort mode)
@@ -373,46 +600,49 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
             piece_id,
             heating_rate,
             outdoor_temp,
+            now=now,
         )
 
     def _get_outdoor_temperature(self) -> float | None:
         """Get outdoor temperature from weather entity if available."""
-        # Try common weather entity patterns
-        weather_entities = [
-            "weather.home",
-            "weather.maison",
-            "sensor.outdoor_temperature",
-            "sensor.temperature_exterieure",
-        ]
+        get_state = self.hass.states.get
 
-        for entity_id in weather_entities:
-            state = self.hass.states.get(entity_id)
-            if state:
-                # Weather entities have temperature in attributes
-                if entity_id.startswith("weather."):
-                    temp = state.attributes.get("temperature")
-                    if temp is not None:
-                        try:
-                            return float(temp)
-                        except ValueError:
-                            pass
-                # Sensor entities have temperature in state
-                else:
-                    if state.state not in ("unknown", "unavailable"):
-                        try:
-                            return float(state.state)
-                        except ValueError:
-                            pass
+        # Most installs always answer from the same entity, try it first
+        if (entity_id := self._outdoor_entity) is not None:
+            temp = _read_outdoor_temperature(entity_id, get_state(entity_id))
+            if temp is not None:
+                return temp
+
+        for entity_id in OUTDOOR_TEMPERATURE_ENTITIES:
+            temp = _read_outdoor_temperature(entity_id, get_state(entity_id))
+            if temp is not None:
+                self._outdoor_entity = entity_id
+                return temp
 
+        self._outdoor_entity = None
         return None
 
-    async def _get_calendar_events(self) -> list[dict[str, Any]]:
-        """Get current and upcoming events from the calendar."""
-        now = dt_util.now()
+    async def _get_calendar_events(
+        self, *, now: datetime | None = None
+    ) -> list[_CalendarEvent]:
+        """Get current and upcoming events from the calendar, normalized once per fetch."""
+        if now is None:
+            now = dt_util.now()
+
+        # The calendar state changes whenever an event starts or ends, reuse the
+        # last fetch while it is unchanged and recent enough to catch new events
+        calendar_state = self.hass.states.get(self.calendar_entity)
+        last_updated = calendar_state.last_updated if calendar_state else None
+        if (cache := self._calendar_cache) is not None:
+            fetched_at, fetched_last_updated, events = cache
+            ttl = self.update_interval * CALENDAR_CACHE_INTERVALS
+            if fetched_last_updated == last_updated and now - fetched_at < ttl:
+                return events
+
         end = now + timedelta(hours=24)
 
         try:
-            events = await self.hass.services.async_call(
+            response = await self.hass.services.async_call(
                 "calendar",
                 "get_events",
                 {
@@ -423,12 +653,22 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
                 blocking=True,
                 return_response=True,
             )
-            return events.get(self.calendar_entity, {}).get("events", [])
         except Exception as err:
             _LOGGER.warning("Failed to get calendar events: %s", err)
             return []
 
-    def _parse_calendar_events(self, events: list[dict[str, Any]]) -> dict[str, Any]:
+        events = _normalize_events(response.get(self.calendar_entity, {}).get("events", []))
+        self._calendar_cache = (now, last_updated, events)
+        return events
+
+    @callback
+    def async_invalidate_calendar(self) -> None:
+        """Fetch the calendar events again on the next refresh."""
+        self._calendar_cache = None
+
+    def _parse_calendar_events(
+        self, events: list[_CalendarEvent], *, now: datetime | None = None
+    ) -> dict[str, Any]:
         """Parse calendar events into structured format."""
         result = {
             "absence": False,
@@ -436,34 +676,23 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
             "confort_pieces": set(),
         }
 
-        now = dt_util.now()
+        if now is None:
+            now = dt_util.now()
 
-        for event in events:
+        for start, end, summary, _event in events:
             # Check if event is currently active
-            start = event.get("start")
-            end = event.get("end")
-
-            if isinstance(start, str):
-                start = dt_util.parse_datetime(start)
-            if isinstance(end, str):
-                end = dt_util.parse_datetime(end)
-
-            if not start or not end:
+            if end is None:
                 continue
 
             if not (start <= now <= end):
                 continue
 
-            summary = event.get("summary", "").lower().strip()
-            # Normalize separators: support "confort - salon" and "confort salon"
-            summary = summary.replace(" - ", " ")
-
             if summary == EVENT_ABSENCE:
                 result["absence"] = True
             elif summary == EVENT_CONFORT:
                 result["confort_global"] = True
-            elif summary.startswith(f"{EVENT_CONFORT} "):
-                piece_name = summary[len(EVENT_CONFORT) + 1 :].strip()
+            elif summary.startswith(_CONFORT_PREFIX):
+                piece_name = summary[_CONFORT_PREFIX_LEN:].strip()
                 result["confort_pieces"].add(piece_name)
 
         return result
@@ -489,12 +718,7 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
                     pass
 
         # Fallback to first radiator's internal sensor
-        radiateurs = piece_config.get(CONF_PIECE_RADIATEURS, [])
-        # Handle legacy single radiator config
-        if isinstance(radiateurs, str):
-            radiateurs = [radiateurs]
-
-        for radiateur_entity in radiateurs:
+        for radiateur_entity in piece_config.get(CONF_PIECE_RADIATEURS, []):
             state = self.hass.states.get(radiateur_entity)
             if state:
                 current_temp = state.attributes.get("current_temperature")
@@ -506,28 +730,31 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
 
         return None
 
-    def _compute_derivative(self, piece_id: str, current_temp: float | None) -> float | None:
+    def _compute_derivative(
+        self, piece_id: str, current_temp: float | None, *, now: datetime | None = None
+    ) -> float | None:
         """Compute heating rate in °C/h based on temperature history."""
         if current_temp is None:
             return None
 
-        now = dt_util.now()
+        if now is None:
+            now = dt_util.now()
 
-        # Initialize history for this piece if needed
-        if piece_id not in self._temp_history:
-            self._temp_history[piece_id] = []
+        # The first reading of a room has nothing to compare with
+        if not (history := self._temp_history.get(piece_id)):
+            self._temp_history[piece_id] = deque([(now, current_temp)])
+            return None
 
         # Add current reading
-        self._temp_history[piece_id].append((now, current_temp))
+        history.append((now, current_temp))
 
-        # Clean old entries (keep only last derivative_window minutes)
+        # Clean old entries (keep only last derivative_window minutes), readings
+        # are appended in time order so the stale ones are at the left end
         cutoff = now - timedelta(minutes=self.derivative_window)
-        self._temp_history[piece_id] = [
-            (t, temp) for t, temp in self._temp_history[piece_id] if t >= cutoff
-        ]
+        while history[0][0] < cutoff:
+            history.popleft()
 
         # Need at least 2 points to compute derivative
-        history = self._temp_history[piece_id]
         if len(history) < 2:
             return None
 
@@ -541,22 +768,49 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
 
         return (newest_temp - oldest_temp) / time_diff_hours
 
+    def _get_piece_names(self, piece_id: str) -> tuple[str, str]:
+        """Return the lowercased name and id of a room."""
+        if (names := self._piece_names.get(piece_id)) is not None:
+            return names
+        piece_key = piece_id.lower()
+        return piece_key, piece_key
+
     def _resolve_mode(
         self,
         piece_id: str,
         parsed_events: dict[str, Any],
         maison_occupee: bool,
+        *,
+        now: datetime | None = None,
     ) -> tuple[str, str]:
         """Resolve the mode for a room based on priorities."""
-        # Check for manual override first
-        if piece_id in self._mode_overrides:
-            mode, expiry = self._mode_overrides[piece_id]
-            if expiry is None or dt_util.now() < expiry:
-                return mode, SOURCE_OVERRIDE
-            else:
-                # Override expired, remove it
-                del self._mode_overrides[piece_id]
+        return (
+            self._active_override(piece_id, now=now)
+            or self._resolve_global(parsed_events, maison_occupee)
+            or self._resolve_room_specific(piece_id, parsed_events)
+        )
+
+    def _active_override(
+        self, piece_id: str, *, now: datetime | None = None
+    ) -> tuple[str, str] | None:
+        """Return the manual override of a room, dropping it once expired."""
+        if piece_id not in self._mode_overrides:
+            return None
+
+        mode, expiry = self._mode_overrides[piece_id]
+        if expiry is not None and now is None:
+            now = dt_util.now()
+        if expiry is None or now < expiry:
+            return mode, SOURCE_OVERRIDE
+
+        # Override expired, remove it
+        del self._mode_overrides[piece_id]
+        return None
 
+    def _resolve_global(
+        self, parsed_events: dict[str, Any], maison_occupee: bool
+    ) -> tuple[str, str] | None:
+        """Return the mode imposed on every room regardless of its own events."""
         # Priority 1: Absence event → frost protection
         if parsed_events["absence"]:
             return MODE_HORS_GEL, SOURCE_CALENDAR
@@ -565,15 +819,20 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
         if not maison_occupee:
             return MODE_ECO, SOURCE_PRESENCE
 
+        return None
+
+    def _resolve_room_specific(
+        self, piece_id: str, parsed_events: dict[str, Any]
+    ) -> tuple[str, str]:
+        """Resolve the mode of a room from comfort events when no global mode applies."""
         # Priority 3: Room-specific comfort event
-        piece_config = self.pieces.get(piece_id, {})
-        piece_name = piece_config.get(CONF_PIECE_NAME, piece_id).lower()
+        piece_name, piece_key = self._get_piece_names(piece_id)
 
         if piece_name in parsed_events["confort_pieces"]:
             return MODE_CONFORT, SOURCE_CALENDAR
 
         # Also check piece_id as fallback
-        if piece_id.lower() in parsed_events["confort_pieces"]:
+        if piece_key in parsed_events["confort_pieces"]:
             return MODE_CONFORT, SOURCE_CALENDAR
 
         # Priority 4: Global comfort event
@@ -611,25 +870,19 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
 
     def _check_preheat_trigger(
         self,
-        piece_id: str,
-        calendar_events: list[dict[str, Any]],
+        next_comfort: _CalendarEvent | None,
         preheat_time: int,
+        *,
+        now: datetime | None = None,
     ) -> bool:
-        """Check if preheating should be triggered for upcoming event."""
-        now = dt_util.now()
-
-        # Find next comfort event for this piece
-        next_comfort = self._find_next_comfort_event(piece_id, calendar_events)
+        """Check if preheating should be triggered for the next comfort event."""
+        if now is None:
+            now = dt_util.now()
 
         if not next_comfort:
             return False
 
-        start = next_comfort.get("start")
-        if isinstance(start, str):
-            start = dt_util.parse_datetime(start)
-
-        if not start:
-            return False
+        start = next_comfort.start
 
         # Check if event is in the future
         if start <= now:
@@ -639,52 +892,48 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
 
         return minutes_until_event <= preheat_time
 
-    def _find_next_comfort_event(
-        self, piece_id: str, calendar_events: list[dict[str, Any]]
-    ) -> dict[str, Any] | None:
-        """Find the next comfort event for a specific room."""
-        now = dt_util.now()
-        piece_config = self.pieces.get(piece_id, {})
-        piece_name = piece_config.get(CONF_PIECE_NAME, piece_id).lower()
-
-        next_event = None
-        next_start = None
+    def _find_next_comfort_events(
+        self, calendar_events: list[_CalendarEvent], *, now: datetime | None = None
+    ) -> dict[str, _CalendarEvent]:
+        """Find the next comfort event of every room in a single pass."""
+        if now is None:
+            now = dt_util.now()
+        next_events: dict[str, _CalendarEvent] = {}
 
         for event in calendar_events:
-            summary = event.get("summary", "").lower().strip()
-            # Normalize separators: support "confort - salon" and "confort salon"
-            summary = summary.replace(" - ", " ")
-
-            # Check if this is a comfort event for this room or global
-            is_relevant = (
-                summary == EVENT_CONFORT
-                or summary == f"{EVENT_CONFORT} {piece_name}"
-                or summary == f"{EVENT_CONFORT} {piece_id.lower()}"
-            )
-
-            if not is_relevant:
+            start = event.start
+            if start <= now:
                 continue
 
-            start = event.get("start")
-            if isinstance(start, str):
-                start = dt_util.parse_datetime(start)
-
-            if not start or start <= now:
+            # A global comfort event applies to every room
+            if event.summary == EVENT_CONFORT:
+                piece_ids = self.pieces
+            elif (piece_ids := self._comfort_summaries.get(event.summary)) is None:
                 continue
 
-            if next_start is None or start < next_start:
-                next_event = event
-                next_start = start
+            for piece_id in piece_ids:
+                current = next_events.get(piece_id)
+                if current is None or start < current.start:
+                    next_events[piece_id] = event
 
-        return next_event
+        return next_events
 
     async def _set_radiators_temperature(
         self, radiator_entities: list[str], temperature: float
     ) -> None:
         """Set the target temperature on multiple radiators."""
-        for radiator_entity in radiator_entities:
-            try:
-                await self.hass.services.async_call(
+        # Skip radiators already at the target, the call would be a no-op. Reading
+        # the state keeps enforcing the target if it was changed on the radiator.
+        get_state = self.hass.states.get
+        to_write = [
+            radiator_entity
+            for radiator_entity in radiator_entities
+            if (state := get_state(radiator_entity)) is None
+            or state.attributes.get("temperature") != temperature
+        ]
+        results = await asyncio.gather(
+            *(
+                self.hass.services.async_call(
                     "climate",
                     "set_temperature",
                     {
@@ -693,8 +942,13 @@ class ChauffageIntelligentCoordinator(DataUpdateCoordinator):
                     },
                     blocking=True,
                 )
-            except Exception as err:
-                _LOGGER.error("Failed to set temperature on %s: %s", radiator_entity, err)
+                for radiator_entity in to_write
+            ),
+            return_exceptions=True,
+        )
+        for radiator_entity, result in zip(to_write, results, strict=True):
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to set temperature on %s: %s", radiator_entity, result)
 
     async def async_set_mode_override(
         self, piece_id: str, mode: str, duration: int | None = None
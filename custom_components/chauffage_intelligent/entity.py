@@ -0,0 +1,68 @@
+"""Base entities for Chauffage Intelligent."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import ChauffageIntelligentCoordinator
+
+
+class ChauffageIntelligentEntity(CoordinatorEntity[ChauffageIntelligentCoordinator]):
+    """Base entity writing its state only when a coordinator update changed it."""
+
+    _attr_has_entity_name = True
+    _last_fingerprint: tuple[bool, Any] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, skipping no-op writes."""
+        self._update_from_coordinator()
+        fingerprint = (self.available, self._state_fingerprint())
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+        super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Resolve the entity state from the coordinator data once per update."""
+
+    def _state_fingerprint(self) -> Any:
+        """Return the state values whose change needs a state write."""
+        return None
+
+
+class ChauffageIntelligentPieceEntity(ChauffageIntelligentEntity):
+    """Base entity bound to a room managed by the coordinator."""
+
+    def __init__(self, coordinator: ChauffageIntelligentCoordinator, piece_id: str) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._piece_id = piece_id
+        self._update_available()
+
+    @property
+    def available(self) -> bool:
+        """Return the availability resolved on the last coordinator update."""
+        return self._attr_available
+
+    async def async_added_to_hass(self) -> None:
+        """Mark the room as active while this entity is enabled."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_register_active_piece(self._piece_id))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_available()
+        super()._handle_coordinator_update()
+
+    def _update_available(self) -> None:
+        """Resolve availability from the last refresh and this room's data."""
+        coordinator = self.coordinator
+        # Before the first refresh the entity shows its restored state
+        self._attr_available = coordinator.last_update_success and (
+            coordinator.data is None or coordinator.piece_data(self._piece_id) is not None
+        )
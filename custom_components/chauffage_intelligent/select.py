@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_PIECE_NAME,
@@ -19,6 +19,10 @@ from .const import (
     SOURCE_OVERRIDE,
 )
 from .coordinator import ChauffageIntelligentCoordinator
+from .entity import ChauffageIntelligentPieceEntity
+
+# Read-only mapping from display labels back to modes
+_LABEL_TO_MODE = MappingProxyType({label: mode for mode, label in SELECT_OPTION_LABELS.items()})
 
 
 async def async_setup_entry(
@@ -37,13 +41,9 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class ChauffageIntelligentModeSelect(
-    CoordinatorEntity[ChauffageIntelligentCoordinator], SelectEntity
-):
+class ChauffageIntelligentModeSelect(ChauffageIntelligentPieceEntity, SelectEntity):
     """Select entity for manual mode override per room."""
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: ChauffageIntelligentCoordinator,
@@ -51,30 +51,35 @@ class ChauffageIntelligentModeSelect(
         piece_config: dict[str, Any],
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
-        self._piece_id = piece_id
+        super().__init__(coordinator, piece_id)
         self._piece_name = piece_config.get(CONF_PIECE_NAME, piece_id)
         self._attr_unique_id = f"{DOMAIN}_{piece_id}_mode_select"
         self._attr_name = f"{self._piece_name} Mode"
         self._attr_options = [SELECT_OPTION_LABELS[opt] for opt in SELECT_OPTIONS]
+        self._update_from_coordinator()
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
-        if self.coordinator.data is None:
-            return SELECT_OPTION_LABELS[MODE_AUTO]
+    def _state_fingerprint(self) -> tuple[str, dict[str, Any]]:
+        """Return the state compared to skip no-op writes."""
+        return self._attr_current_option, self._attr_extra_state_attributes
 
-        piece_data = self.coordinator.data.get("pieces", {}).get(self._piece_id)
+    def _update_from_coordinator(self) -> None:
+        """Resolve the current option and attributes once per update."""
+        piece_data = self.coordinator.piece_data(self._piece_id)
         if piece_data is None:
-            return SELECT_OPTION_LABELS[MODE_AUTO]
-
-        source = piece_data.get("source")
-        if source == SOURCE_OVERRIDE:
-            current_mode = piece_data.get("mode")
-            if current_mode in SELECT_OPTION_LABELS:
-                return SELECT_OPTION_LABELS[current_mode]
-
-        return SELECT_OPTION_LABELS[MODE_AUTO]
+            self._attr_current_option = SELECT_OPTION_LABELS[MODE_AUTO]
+            self._attr_extra_state_attributes = {}
+            return
+
+        current_mode = piece_data.get("mode")
+        option = SELECT_OPTION_LABELS[MODE_AUTO]
+        if piece_data.get("source") == SOURCE_OVERRIDE and current_mode in SELECT_OPTION_LABELS:
+            option = SELECT_OPTION_LABELS[current_mode]
+        self._attr_current_option = option
+
+        self._attr_extra_state_attributes = {
+            "calculated_mode": current_mode,
+            "source": piece_data.get("source"),
+        }
 
     async def async_select_option(self, option: str) -> None:
         """Handle option selection."""
@@ -87,23 +92,7 @@ class ChauffageIntelligentModeSelect(
 
         await self.coordinator.async_request_refresh()
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        if self.coordinator.data is None:
-            return {}
-
-        piece_data = self.coordinator.data.get("pieces", {}).get(self._piece_id)
-        if piece_data is None:
-            return {}
-
-        return {
-            "calculated_mode": piece_data.get("mode"),
-            "source": piece_data.get("source"),
-        }
-
 
 def _label_to_mode(label: str) -> str:
     """Convert a display label back to mode constant."""
-    label_to_mode_map = {v: k for k, v in SELECT_OPTION_LABELS.items()}
-    return label_to_mode_map.get(label, MODE_AUTO)
+    return _LABEL_TO_MODE.get(label, MODE_AUTO)
@@ -1,6 +1,7 @@
 """Sensor platform for Chauffage Intelligent."""
 from __future__ import annotations
 
+from collections import Counter
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -12,13 +13,13 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_PIECE_NAME,
     DOMAIN,
 )
 from .coordinator import ChauffageIntelligentCoordinator
+from .entity import ChauffageIntelligentEntity, ChauffageIntelligentPieceEntity
 
 
 async def async_setup_entry(
@@ -50,13 +51,9 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class GlobalModeSensor(
-    CoordinatorEntity[ChauffageIntelligentCoordinator], SensorEntity
-):
+class GlobalModeSensor(ChauffageIntelligentEntity, SensorEntity):
     """Sensor showing the dominant mode across all rooms."""
 
-    _attr_has_entity_name = True
-
     def __init__(self, coordinator: ChauffageIntelligentCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -73,20 +70,20 @@ class GlobalModeSensor(
         if not pieces:
             return None
 
-        # Find most common mode
-        modes = [p.get("mode") for p in pieces.values() if p.get("mode")]
+        # Find most common mode, ties go to the first room listed
+        modes = Counter(mode for p in pieces.values() if (mode := p.get("mode")))
         if not modes:
             return None
 
-        return max(set(modes), key=modes.count)
+        return modes.most_common(1)[0][0]
 
+    def _state_fingerprint(self) -> str | None:
+        """Return the state compared to skip no-op writes."""
+        return self.native_value
 
-class RoomModeSensor(
-    CoordinatorEntity[ChauffageIntelligentCoordinator], SensorEntity
-):
-    """Sensor showing the calculated mode for a room."""
 
-    _attr_has_entity_name = True
+class RoomModeSensor(ChauffageIntelligentPieceEntity, SensorEntity):
+    """Sensor showing the calculated mode for a room."""
 
     def __init__(
         self,
@@ -95,39 +92,53 @@ class RoomModeSensor(
         piece_config: dict[str, Any],
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._piece_id = piece_id
+        super().__init__(coordinator, piece_id)
         self._attr_unique_id = f"{DOMAIN}_{piece_id}_mode_calcule"
         self._attr_name = f"{piece_config.get(CONF_PIECE_NAME, piece_id)} Mode"
+        self._update_from_coordinator()
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the calculated mode."""
-        if self.coordinator.data is None:
-            return None
-        piece_data = self.coordinator.data.get("pieces", {}).get(self._piece_id)
-        return piece_data.get("mode") if piece_data else None
+    def _state_fingerprint(self) -> tuple[Any, dict[str, Any]]:
+        """Return the state compared to skip no-op writes."""
+        return self._attr_native_value, self._attr_extra_state_attributes
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra attributes."""
-        if self.coordinator.data is None:
-            return {}
-        piece_data = self.coordinator.data.get("pieces", {}).get(self._piece_id)
-        if piece_data:
-            return {"source": piece_data.get("source")}
-        return {}
+    def _update_from_coordinator(self) -> None:
+        """Resolve the calculated mode and its attributes once per update."""
+        piece_data = self.coordinator.piece_data(self._piece_id)
+        if not piece_data:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+            return
+        self._attr_native_value = piece_data.get("mode")
+        self._attr_extra_state_attributes = {"source": piece_data.get("source")}
+
+
+class RoomValueSensor(ChauffageIntelligentPieceEntity, SensorEntity):
+    """Base sensor exposing one value of a room's computed data."""
+
+    _data_key: str
+
+    def __init__(self, coordinator: ChauffageIntelligentCoordinator, piece_id: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, piece_id)
+        self._update_from_coordinator()
+
+    def _state_fingerprint(self) -> Any:
+        """Return the state compared to skip no-op writes."""
+        return self._attr_native_value
 
+    def _update_from_coordinator(self) -> None:
+        """Resolve the sensor value once per update."""
+        piece_data = self.coordinator.piece_data(self._piece_id)
+        self._attr_native_value = piece_data.get(self._data_key) if piece_data else None
 
-class RoomTargetTempSensor(
-    CoordinatorEntity[ChauffageIntelligentCoordinator], SensorEntity
-):
+
+class RoomTargetTempSensor(RoomValueSensor):
     """Sensor showing the target temperature for a room."""
 
-    _attr_has_entity_name = True
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _data_key = "consigne"
 
     def __init__(
         self,
@@ -136,28 +147,17 @@ class RoomTargetTempSensor(
         piece_config: dict[str, Any],
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._piece_id = piece_id
+        super().__init__(coordinator, piece_id)
         self._attr_unique_id = f"{DOMAIN}_{piece_id}_temperature_cible"
         self._attr_name = f"{piece_config.get(CONF_PIECE_NAME, piece_id)} Température Cible"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the target temperature."""
-        if self.coordinator.data is None:
-            return None
-        piece_data = self.coordinator.data.get("pieces", {}).get(self._piece_id)
-        return piece_data.get("consigne") if piece_data else None
-
 
-class RoomPreheatTimeSensor(
-    CoordinatorEntity[ChauffageIntelligentCoordinator], SensorEntity
-):
+class RoomPreheatTimeSensor(RoomValueSensor):
     """Sensor showing the estimated preheat time for a room."""
 
-    _attr_has_entity_name = True
     _attr_native_unit_of_measurement = "min"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_key = "temps_prechauffage"
 
     def __init__(
         self,
@@ -166,28 +166,17 @@ class RoomPreheatTimeSensor(
         piece_config: dict[str, Any],
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._piece_id = piece_id
+        super().__init__(coordinator, piece_id)
         self._attr_unique_id = f"{DOMAIN}_{piece_id}_temps_prechauffage"
         self._attr_name = f"{piece_config.get(CONF_PIECE_NAME, piece_id)} Temps Préchauffage"
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the estimated preheat time in minutes."""
-        if self.coordinator.data is None:
-            return None
-        piece_data = self.coordinator.data.get("pieces", {}).get(self._piece_id)
-        return piece_data.get("temps_prechauffage") if piece_data else None
 
-
-class RoomHeatingRateSensor(
-    CoordinatorEntity[ChauffageIntelligentCoordinator], SensorEntity
-):
+class RoomHeatingRateSensor(RoomValueSensor):
     """Sensor showing the current heating rate for a room."""
 
-    _attr_has_entity_name = True
     _attr_native_unit_of_measurement = "°C/h"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_key = "vitesse_chauffe"
 
     def __init__(
         self,
@@ -196,18 +185,12 @@ class RoomHeatingRateSensor(
         piece_config: dict[str, Any],
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._piece_id = piece_id
+        super().__init__(coordinator, piece_id)
         self._attr_unique_id = f"{DOMAIN}_{piece_id}_vitesse_chauffe"
         self._attr_name = f"{piece_config.get(CONF_PIECE_NAME, piece_id)} Vitesse Chauffe"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the heating rate in °C/h."""
-        if self.coordinator.data is None:
-            return None
-        piece_data = self.coordinator.data.get("pieces", {}).get(self._piece_id)
-        rate = piece_data.get("vitesse_chauffe") if piece_data else None
-        if rate is not None:
-            return round(rate, 2)
-        return None
+    def _update_from_coordinator(self) -> None:
+        """Resolve the heating rate in °C/h, rounded, once per update."""
+        super()._update_from_coordinator()
+        if self._attr_native_value is not None:
+            self._attr_native_value = round(self._attr_native_value, 2)
@@ -1,6 +1,11 @@
 """Tests for binary sensor entities."""
 from __future__ import annotations
 
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.const import STATE_ON
+
 from custom_components.chauffage_intelligent.binary_sensor import (
     HomeOccupiedSensor,
     RoomPreheatActiveSensor,
@@ -39,6 +44,41 @@ class TestHomeOccupiedSensor:
 
         assert sensor.is_on is None
 
+    def test_coordinator_update_refreshes_state(self, coordinator):
+        """Test that a coordinator update refreshes is_on."""
+        coordinator.data = {"maison_occupee": False}
+        sensor = HomeOccupiedSensor(coordinator)
+        sensor.async_write_ha_state = MagicMock()
+
+        coordinator.data = {"maison_occupee": True}
+        sensor._handle_coordinator_update()
+
+        assert sensor.is_on is True
+        sensor.async_write_ha_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_restores_last_state_without_data(self, coordinator):
+        """Test that the last known state is used until the first refresh."""
+        coordinator.data = None
+        sensor = HomeOccupiedSensor(coordinator)
+        sensor.async_get_last_state = AsyncMock(return_value=MagicMock(state=STATE_ON))
+
+        await sensor.async_added_to_hass()
+
+        assert sensor.is_on is True
+
+    @pytest.mark.asyncio
+    async def test_ignores_last_state_with_data(self, coordinator):
+        """Test that coordinator data takes precedence over the last state."""
+        coordinator.data = {"maison_occupee": False}
+        sensor = HomeOccupiedSensor(coordinator)
+        sensor.async_get_last_state = AsyncMock(return_value=MagicMock(state=STATE_ON))
+
+        await sensor.async_added_to_hass()
+
+        assert sensor.is_on is False
+        sensor.async_get_last_state.assert_not_called()
+
 
 class TestRoomPreheatActiveSensor:
     """Test RoomPreheatActiveSensor."""
@@ -93,3 +133,38 @@ class TestRoomPreheatActiveSensor:
         sensor = RoomPreheatActiveSensor(coordinator, "bureau", {})
 
         assert sensor.is_on is None
+
+    def test_coordinator_update_refreshes_state(self, coordinator):
+        """Test that a coordinator update refreshes is_on."""
+        coordinator.data = {"pieces": {"bureau": {"prechauffage_actif": False}}}
+        sensor = RoomPreheatActiveSensor(coordinator, "bureau", {})
+        sensor.async_write_ha_state = MagicMock()
+
+        coordinator.data = {"pieces": {"bureau": {"prechauffage_actif": True}}}
+        sensor._handle_coordinator_update()
+
+        assert sensor.is_on is True
+        sensor.async_write_ha_state.assert_called_once()
+
+    def test_coordinator_update_skips_unchanged_state(self, coordinator):
+        """Test that an unchanged preheat flag does not trigger a state write."""
+        coordinator.data = {"pieces": {"bureau": {"prechauffage_actif": True}}}
+        sensor = RoomPreheatActiveSensor(coordinator, "bureau", {})
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_coordinator_update()
+        coordinator.data = {"pieces": {"bureau": {"prechauffage_actif": True, "mode": "eco"}}}
+        sensor._handle_coordinator_update()
+
+        sensor.async_write_ha_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_restores_last_state_without_data(self, coordinator):
+        """Test that the last known state is used until the first refresh."""
+        coordinator.data = None
+        sensor = RoomPreheatActiveSensor(coordinator, "bureau", {})
+        sensor.async_get_last_state = AsyncMock(return_value=MagicMock(state=STATE_ON))
+
+        await sensor.async_added_to_hass()
+
+        assert sensor.is_on is True
@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from unittest.mock import patch
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.chauffage_intelligent.const import (
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+)
+from custom_components.chauffage_intelligent.coordinator import (
+    CALENDAR_CACHE_INTERVALS,
+    _normalize_events,
+)
 
 
 class TestCalendarEventParsing:
@@ -14,7 +25,7 @@ class TestCalendarEventParsing:
         events = [calendar_event_factory("Absence", offset_minutes=-30, duration_minutes=120)]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         assert result["absence"] is True
         assert result["confort_global"] is False
@@ -25,7 +36,7 @@ class TestCalendarEventParsing:
         events = [calendar_event_factory("Confort", offset_minutes=-30, duration_minutes=120)]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         assert result["absence"] is False
         assert result["confort_global"] is True
@@ -38,7 +49,7 @@ class TestCalendarEventParsing:
         ]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         assert result["absence"] is False
         assert result["confort_global"] is False
@@ -51,7 +62,7 @@ class TestCalendarEventParsing:
         ]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         assert "bureau" in result["confort_pieces"]
 
@@ -62,7 +73,7 @@ class TestCalendarEventParsing:
         ]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         assert "bureau" in result["confort_pieces"]
 
@@ -72,7 +83,7 @@ class TestCalendarEventParsing:
         events = [calendar_event_factory("Confort", offset_minutes=120, duration_minutes=60)]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         # Event is in the future, so not active
         assert result["confort_global"] is False
@@ -83,7 +94,7 @@ class TestCalendarEventParsing:
         events = [calendar_event_factory("Confort", offset_minutes=-120, duration_minutes=60)]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         # Event has ended, so not active
         assert result["confort_global"] is False
@@ -96,7 +107,7 @@ class TestCalendarEventParsing:
         ]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         assert "bureau" in result["confort_pieces"]
         assert "chambre" in result["confort_pieces"]
@@ -110,7 +121,7 @@ class TestCalendarEventParsing:
         ]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         # Both should be captured; priority is handled in _resolve_mode
         assert result["absence"] is True
@@ -121,7 +132,7 @@ class TestCalendarEventParsing:
         events = [calendar_event_factory("", offset_minutes=-30, duration_minutes=120)]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         assert result["absence"] is False
         assert result["confort_global"] is False
@@ -134,7 +145,7 @@ class TestCalendarEventParsing:
         ]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         assert result["absence"] is False
         assert result["confort_global"] is False
@@ -147,7 +158,7 @@ class TestCalendarEventParsing:
         ]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         assert "salon" in result["confort_pieces"]
 
@@ -159,7 +170,7 @@ class TestCalendarEventParsing:
         ]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         assert "bureau" in result["confort_pieces"]
         assert "chambre" in result["confort_pieces"]
@@ -172,7 +183,110 @@ class TestCalendarEventParsing:
         ]
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
-            result = coordinator._parse_calendar_events(events)
+            result = coordinator._parse_calendar_events(_normalize_events(events))
 
         assert "bureau" in result["confort_pieces"]
         assert "salon" in result["confort_pieces"]
+
+
+class TestEventNormalization:
+    """Test normalizing calendar events once per update."""
+
+    def test_dates_and_summary_normalized(self, calendar_event_factory):
+        """Test that dates are parsed and the summary separator is normalized."""
+        event = calendar_event_factory("  Confort - Salon ", offset_minutes=30)
+
+        (normalized,) = _normalize_events([event])
+
+        assert normalized.summary == "confort salon"
+        assert isinstance(normalized.start, datetime)
+        assert normalized.end - normalized.start == timedelta(minutes=60)
+        assert normalized.event is event
+
+    def test_event_without_start_skipped(self, calendar_event_factory):
+        """Test that events without a parsable start are dropped."""
+        event = calendar_event_factory("Confort Salon")
+        event["start"] = None
+
+        assert _normalize_events([event]) == []
+
+
+class TestCalendarCache:
+    """Test reusing fetched calendar events between refreshes."""
+
+    @pytest.fixture
+    def calendar(self, coordinator, mock_hass, calendar_event_factory):
+        """Return the mocked calendar state and service."""
+        state = MagicMock()
+        state.last_updated = datetime(2024, 1, 15, 8, 0)
+        mock_hass.states.get.side_effect = lambda entity_id: state
+        mock_hass.services.async_call.return_value = {
+            coordinator.calendar_entity: {"events": [calendar_event_factory("Confort")]}
+        }
+        return state, mock_hass.services.async_call
+
+    @pytest.mark.asyncio
+    async def test_events_reused_within_ttl(self, coordinator, calendar):
+        """Test that a recent fetch is reused while the calendar is unchanged."""
+        _, async_call = calendar
+        now = datetime(2024, 1, 15, 9, 0)
+
+        first = await coordinator._get_calendar_events(now=now)
+        second = await coordinator._get_calendar_events(now=now + timedelta(minutes=4))
+
+        assert second is first
+        async_call.assert_awaited_once()
+        assert first[0].summary == "confort"
+        assert isinstance(first[0].start, datetime)
+
+    @pytest.mark.asyncio
+    async def test_events_fetched_again(self, coordinator, calendar):
+        """Test that expiry, calendar changes and invalidation trigger a fetch."""
+        state, async_call = calendar
+        now = datetime(2024, 1, 15, 9, 0)
+        ttl = coordinator.update_interval * CALENDAR_CACHE_INTERVALS
+        await coordinator._get_calendar_events(now=now)
+
+        now += ttl
+        await coordinator._get_calendar_events(now=now)
+        state.last_updated = now
+        await coordinator._get_calendar_events(now=now + timedelta(minutes=1))
+        coordinator.async_invalidate_calendar()
+        await coordinator._get_calendar_events(now=now + timedelta(minutes=2))
+
+        assert async_call.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_events_reused_on_next_scheduled_refresh(self, coordinator, calendar):
+        """Test that the refresh one default interval later reuses the fetch."""
+        _, async_call = calendar
+        now = datetime(2024, 1, 15, 9, 0)
+
+        await coordinator._get_calendar_events(now=now)
+        await coordinator._get_calendar_events(
+            now=now + timedelta(seconds=DEFAULT_UPDATE_INTERVAL)
+        )
+
+        async_call.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ttl_follows_update_interval(self, coordinator, calendar, basic_config):
+        """Test that a shorter update interval from the options shortens the TTL."""
+        _, async_call = calendar
+        now = datetime(2024, 1, 15, 9, 0)
+        assert coordinator.async_update_settings({**basic_config, CONF_UPDATE_INTERVAL: 60})
+
+        await coordinator._get_calendar_events(now=now)
+        await coordinator._get_calendar_events(now=now + timedelta(minutes=6))
+
+        assert async_call.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_not_cached(self, coordinator, calendar):
+        """Test that a failed fetch is retried on the next refresh."""
+        _, async_call = calendar
+        async_call.side_effect = [Exception("timeout"), async_call.return_value]
+        now = datetime(2024, 1, 15, 9, 0)
+
+        assert await coordinator._get_calendar_events(now=now) == []
+        assert len(await coordinator._get_calendar_events(now=now)) == 1
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant.components.climate import HVACMode
@@ -191,6 +191,64 @@ class TestChauffageIntelligentClimate:
         assert attrs["learning_samples"] == 42
         assert attrs["learning_avg_rate"] == 1.35
 
+    def test_coordinator_update_refreshes_cached_state(self, coordinator, piece_config):
+        """Test that a coordinator update refreshes the cached state."""
+        coordinator.data = {"pieces": {"bureau": {"mode": "eco", "temperature": 18.0}}}
+        climate = ChauffageIntelligentClimate(coordinator, "bureau", piece_config)
+        climate.async_write_ha_state = MagicMock()
+
+        coordinator.data = {
+            "pieces": {
+                "bureau": {"mode": MODE_OFF, "source": SOURCE_OVERRIDE, "temperature": 18.5}
+            }
+        }
+        climate._handle_coordinator_update()
+
+        assert climate.current_temperature == 18.5
+        assert climate.hvac_mode == HVACMode.OFF
+        assert climate.extra_state_attributes["mode_calcule"] == MODE_OFF
+        assert climate.extra_state_attributes["type_piece"] == "bureau"
+        climate.async_write_ha_state.assert_called_once()
+
+    def test_extra_state_attributes_are_read_only(self, coordinator, piece_config):
+        """Test that the cached attributes cannot be mutated by callers."""
+        coordinator.data = {"pieces": {"bureau": {"mode": "eco"}}}
+        climate = ChauffageIntelligentClimate(coordinator, "bureau", piece_config)
+
+        with pytest.raises(TypeError):
+            climate.extra_state_attributes["mode_calcule"] = MODE_CONFORT
+
+    def test_coordinator_update_skips_unchanged_state(self, coordinator, piece_config):
+        """Test that identical room data does not trigger a new state write."""
+        coordinator.data = {"pieces": {"bureau": {"mode": "eco", "temperature": 18.0}}}
+        climate = ChauffageIntelligentClimate(coordinator, "bureau", piece_config)
+        climate.async_write_ha_state = MagicMock()
+
+        climate._handle_coordinator_update()
+        coordinator.data = {"pieces": {"bureau": {"mode": "eco", "temperature": 18.0}}}
+        climate._handle_coordinator_update()
+
+        climate.async_write_ha_state.assert_called_once()
+
+    def test_coordinator_update_writes_on_failure(self, coordinator, piece_config):
+        """Test that a failed refresh is still written to update availability."""
+        coordinator.data = {"pieces": {"bureau": {"mode": "eco"}}}
+        climate = ChauffageIntelligentClimate(coordinator, "bureau", piece_config)
+        climate.async_write_ha_state = MagicMock()
+
+        climate._handle_coordinator_update()
+        coordinator.last_update_success = False
+        climate._handle_coordinator_update()
+
+        assert climate.async_write_ha_state.call_count == 2
+
+    def test_legacy_single_radiator_config(self, coordinator, piece_config):
+        """Test that a legacy single radiator string is exposed as a list."""
+        piece_config[CONF_PIECE_RADIATEURS] = "climate.bilbao_bureau"
+        climate = ChauffageIntelligentClimate(coordinator, "bureau", piece_config)
+
+        assert climate.extra_state_attributes["radiateur_entities"] == ["climate.bilbao_bureau"]
+
 
 class TestChauffageIntelligentClimateActions:
     """Test ChauffageIntelligentClimate actions."""
@@ -225,6 +283,16 @@ class TestChauffageIntelligentClimateActions:
 
         coordinator.async_set_mode_override.assert_called_once_with("bureau", MODE_HORS_GEL)
 
+    @pytest.mark.asyncio
+    async def test_async_set_temperature_default_thresholds(self, coordinator):
+        """Test setpoint mapping falls back to default thresholds."""
+        coordinator.async_set_mode_override = AsyncMock()
+        climate = ChauffageIntelligentClimate(coordinator, "bureau", {})
+
+        await climate.async_set_temperature(**{ATTR_TEMPERATURE: 17.0})
+
+        coordinator.async_set_mode_override.assert_called_once_with("bureau", MODE_ECO)
+
     @pytest.mark.asyncio
     async def test_async_set_temperature_none(self, coordinator, piece_config):
         """Test setting temperature with None does nothing."""
@@ -362,3 +430,38 @@ class TestChauffageIntelligentClimatePresetModes:
 
         coordinator.async_set_mode_override.assert_not_called()
         coordinator.async_reset_mode_override.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_restores_last_state_without_data(self, coordinator, piece_config):
+        """Test that the last known state is used until the first refresh."""
+        coordinator.data = None
+        climate = ChauffageIntelligentClimate(coordinator, "bureau", piece_config)
+        last_state = MagicMock(
+            state=HVACMode.OFF,
+            attributes={
+                "current_temperature": 18.5,
+                ATTR_TEMPERATURE: 17,
+                "preset_mode": PRESET_ECO,
+            },
+        )
+        climate.async_get_last_state = AsyncMock(return_value=last_state)
+
+        await climate.async_added_to_hass()
+
+        assert climate.current_temperature == 18.5
+        assert climate.target_temperature == 17
+        assert climate.hvac_mode == HVACMode.OFF
+        assert climate.preset_mode == PRESET_ECO
+
+    @pytest.mark.asyncio
+    async def test_restore_ignores_unknown_values(self, coordinator, piece_config):
+        """Test that unexpected restored values keep the defaults."""
+        coordinator.data = None
+        climate = ChauffageIntelligentClimate(coordinator, "bureau", piece_config)
+        last_state = MagicMock(state="unavailable", attributes={"preset_mode": "Unknown"})
+        climate.async_get_last_state = AsyncMock(return_value=last_state)
+
+        await climate.async_added_to_hass()
+
+        assert climate.hvac_mode == HVACMode.HEAT
+        assert climate.preset_mode == PRESET_AUTO
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import voluptuous as vol
 
 from custom_components.chauffage_intelligent.config_flow import (
     ChauffageIntelligentConfigFlow,
     ChauffageIntelligentOptionsFlow,
+    _build_room_schema,
+    _entity_dropdown,
+    _get_all_temperature_sensors,
     _get_areas_with_climate,
     _get_climate_entities_for_area,
     _get_temperature_sensors_for_area,
@@ -32,6 +37,26 @@ from custom_components.chauffage_intelligent.const import (
 )
 
 
+@contextmanager
+def _patch_area_indices(direct, devices, device_entries):
+    """Patch the registry area and device indices used by the area helpers."""
+    with (
+        patch(
+            "custom_components.chauffage_intelligent.config_flow.er.async_entries_for_area",
+            return_value=direct,
+        ) as entity_entries_for_area,
+        patch(
+            "homeassistant.helpers.device_registry.async_entries_for_area",
+            return_value=devices,
+        ) as device_entries_for_area,
+        patch(
+            "custom_components.chauffage_intelligent.config_flow.er.async_entries_for_device",
+            side_effect=lambda _reg, device_id, **_kw: device_entries.get(device_id, []),
+        ) as entries_for_device,
+    ):
+        yield entity_entries_for_area, device_entries_for_area, entries_for_device
+
+
 class TestConfigFlow:
     """Test the config flow."""
 
@@ -63,7 +88,9 @@ class TestConfigFlow:
             "climate": [climate_state],
             "sensor": [sensor_state],
         }
-        hass.states.async_all = lambda domain: domain_states.get(domain, [])
+        hass.states.async_entity_ids = lambda domain: [
+            state.entity_id for state in domain_states.get(domain, [])
+        ]
         hass.states.get = lambda entity_id: {
             "sensor.temperature_bureau": sensor_state,
         }.get(entity_id)
@@ -88,7 +115,7 @@ class TestConfigFlow:
     @pytest.mark.asyncio
     async def test_async_step_user_no_calendars(self, mock_hass):
         """Test user step shows error when no calendars."""
-        mock_hass.states.async_all = lambda domain: []
+        mock_hass.states.async_entity_ids = lambda domain: []
 
         flow = ChauffageIntelligentConfigFlow()
         flow.hass = mock_hass
@@ -130,6 +157,69 @@ class TestConfigFlow:
         assert result["type"] == "form"
         assert result["step_id"] == "room_menu"
 
+    @pytest.mark.asyncio
+    async def test_async_step_room_menu_offers_finish_with_rooms(self, mock_hass):
+        """Test the finish action is only offered once a room is configured."""
+        flow = ChauffageIntelligentConfigFlow()
+        flow.hass = mock_hass
+        flow._data = {CONF_PIECES: {}}
+
+        def action_values(result):
+            (action_selector,) = result["data_schema"].schema.values()
+            return [option["value"] for option in action_selector.config["options"]]
+
+        assert action_values(await flow.async_step_room_menu(None)) == [
+            "add_room",
+            "add_all_rooms",
+        ]
+
+        flow._data[CONF_PIECES]["bureau"] = {}
+        assert action_values(await flow.async_step_room_menu(None)) == [
+            "add_room",
+            "add_all_rooms",
+            "finish",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_step_room_menu_add_all_rooms(self, mock_hass):
+        """Test adding every detected room at once with default settings."""
+        flow = ChauffageIntelligentConfigFlow()
+        flow.hass = mock_hass
+        flow._data = {CONF_PIECES: {"bureau": {}}}
+
+        with (
+            patch(
+                "custom_components.chauffage_intelligent.config_flow._get_areas_with_climate",
+                return_value=[
+                    {"value": "bureau", "label": "Bureau"},
+                    {"value": "cave", "label": "Cave"},
+                    {"value": "salon", "label": "Salon"},
+                ],
+            ),
+            patch(
+                "custom_components.chauffage_intelligent.config_flow._get_climate_entities_for_area",
+                side_effect=lambda _er, _dr, area_id: (
+                    ["climate.salon"] if area_id == "salon" else []
+                ),
+            ),
+            patch(
+                "custom_components.chauffage_intelligent.config_flow._get_temperature_sensors_for_area",
+                return_value=["sensor.temperature_salon"],
+            ),
+            patch("custom_components.chauffage_intelligent.config_flow.er.async_get"),
+            patch("custom_components.chauffage_intelligent.config_flow.dr.async_get"),
+        ):
+            result = await flow.async_step_room_menu({"action": "add_all_rooms"})
+
+        assert result["step_id"] == "room_menu"
+        assert result["errors"] == {}
+        assert list(flow._data[CONF_PIECES]) == ["bureau", "salon"]
+        salon = flow._data[CONF_PIECES]["salon"]
+        assert salon[CONF_PIECE_NAME] == "Salon"
+        assert salon[CONF_PIECE_TYPE] == "autre"
+        assert salon[CONF_PIECE_RADIATEURS] == ["climate.salon"]
+        assert salon[CONF_PIECE_SONDE] == "sensor.temperature_salon"
+
     @pytest.mark.asyncio
     async def test_async_step_room_menu_finish_without_rooms(self, mock_hass):
         """Test finish action fails when no rooms added."""
@@ -271,7 +361,9 @@ class TestOptionsFlow:
             "climate": [climate_state],
             "sensor": [sensor_state],
         }
-        hass.states.async_all = lambda domain: domain_states.get(domain, [])
+        hass.states.async_entity_ids = lambda domain: [
+            state.entity_id for state in domain_states.get(domain, [])
+        ]
         hass.states.get = lambda entity_id: {
             "sensor.temperature_bureau": sensor_state,
         }.get(entity_id)
@@ -456,26 +548,13 @@ class TestHelperFunctions:
 
     @pytest.fixture
     def mock_hass(self):
-        """Create a mock hass instance with registries."""
-        hass = MagicMock()
-
-        # Mock sensor state with temperature device class
-        sensor_state = MagicMock()
-        sensor_state.entity_id = "sensor.temperature_bureau"
-        sensor_state.attributes = {"device_class": "temperature"}
-
-        # Mock sensor without temperature class
-        other_sensor_state = MagicMock()
-        other_sensor_state.entity_id = "sensor.humidity_bureau"
-        other_sensor_state.attributes = {"device_class": "humidity"}
-
-        hass.states.get = lambda entity_id: {
-            "sensor.temperature_bureau": sensor_state,
-            "sensor.humidity_bureau": other_sensor_state,
-            "sensor.temperature_salon": sensor_state,
-        }.get(entity_id)
+        """Create a mock hass instance."""
+        return MagicMock()
 
-        return hass
+    @pytest.fixture
+    def registries(self):
+        """Create mock entity and device registries."""
+        return MagicMock(), MagicMock()
 
     def test_get_areas_with_climate_direct_area(self, mock_hass):
         """Test getting areas with climate entities assigned directly."""
@@ -500,7 +579,7 @@ class TestHelperFunctions:
             mock_area = MagicMock()
             mock_area.id = "bureau"
             mock_area.name = "Bureau"
-            mock_ar.return_value.async_get_area.return_value = mock_area
+            mock_ar.return_value.areas = {"bureau": mock_area}
 
             result = _get_areas_with_climate(mock_hass)
 
@@ -533,7 +612,7 @@ class TestHelperFunctions:
             mock_area = MagicMock()
             mock_area.id = "salon"
             mock_area.name = "Salon"
-            mock_ar.return_value.async_get_area.return_value = mock_area
+            mock_ar.return_value.areas = {"salon": mock_area}
 
             result = _get_areas_with_climate(mock_hass)
 
@@ -541,122 +620,139 @@ class TestHelperFunctions:
             assert result[0]["value"] == "salon"
             assert result[0]["label"] == "Salon"
 
-    def test_get_climate_entities_for_area_direct(self, mock_hass):
-        """Test getting climate entities directly assigned to area."""
-        with (
-            patch("custom_components.chauffage_intelligent.config_flow.er.async_get") as mock_er,
-            patch("homeassistant.helpers.device_registry.async_get") as mock_dr,
-        ):
-            # Setup entity registry
-            mock_entity = MagicMock()
-            mock_entity.domain = "climate"
-            mock_entity.entity_id = "climate.bureau"
-            mock_entity.area_id = "bureau"
-            mock_entity.device_id = None
-
-            mock_other_entity = MagicMock()
-            mock_other_entity.domain = "light"
-            mock_other_entity.entity_id = "light.bureau"
-            mock_other_entity.area_id = "bureau"
-            mock_other_entity.device_id = None
-
-            mock_er.return_value.entities.values.return_value = [
-                mock_entity,
-                mock_other_entity,
-            ]
-            mock_dr.return_value.async_get.return_value = None
+    @staticmethod
+    def _entry(domain: str, entity_id: str, device_class: str | None = None):
+        """Create a mock registry entry."""
+        entry = MagicMock()
+        entry.domain = domain
+        entry.entity_id = entity_id
+        entry.device_class = None
+        entry.original_device_class = device_class
+        return entry
 
-            result = _get_climate_entities_for_area(mock_hass, "bureau")
+    def test_get_climate_entities_for_area_direct(self, registries):
+        """Test getting climate entities directly assigned to area."""
+        direct = [
+            self._entry("climate", "climate.bureau"),
+            self._entry("light", "light.bureau"),
+        ]
+        with _patch_area_indices(direct, [], {}):
+            result = _get_climate_entities_for_area(*registries, "bureau")
 
-            assert result == ["climate.bureau"]
+        assert result == ["climate.bureau"]
 
-    def test_get_climate_entities_for_area_via_device(self, mock_hass):
+    def test_get_climate_entities_for_area_via_device(self, registries):
         """Test getting climate entities via device area."""
-        with (
-            patch("custom_components.chauffage_intelligent.config_flow.er.async_get") as mock_er,
-            patch("homeassistant.helpers.device_registry.async_get") as mock_dr,
-        ):
-            # Setup entity registry with climate entity (no direct area)
-            mock_entity = MagicMock()
-            mock_entity.domain = "climate"
-            mock_entity.entity_id = "climate.salon"
-            mock_entity.area_id = None
-            mock_entity.device_id = "device_123"
-
-            mock_er.return_value.entities.values.return_value = [mock_entity]
+        mock_device = MagicMock()
+        mock_device.id = "device_123"
+        device_entries = {"device_123": [self._entry("climate", "climate.salon")]}
+        with _patch_area_indices([], [mock_device], device_entries):
+            result = _get_climate_entities_for_area(*registries, "salon")
 
-            # Setup device in area
-            mock_device = MagicMock()
-            mock_device.area_id = "salon"
-            mock_dr.return_value.async_get.return_value = mock_device
+        assert result == ["climate.salon"]
 
-            result = _get_climate_entities_for_area(mock_hass, "salon")
+    def test_get_climate_entities_for_area_deduplicates(self, registries):
+        """Test that an entity in the area both directly and via device is listed once."""
+        entry = self._entry("climate", "climate.salon")
+        mock_device = MagicMock()
+        mock_device.id = "device_123"
+        with _patch_area_indices([entry], [mock_device], {"device_123": [entry]}):
+            result = _get_climate_entities_for_area(*registries, "salon")
 
-            assert result == ["climate.salon"]
+        assert result == ["climate.salon"]
 
-    def test_get_temperature_sensors_for_area_direct(self, mock_hass):
-        """Test getting temperature sensors directly assigned to area."""
-        with (
-            patch("custom_components.chauffage_intelligent.config_flow.er.async_get") as mock_er,
-            patch("homeassistant.helpers.device_registry.async_get") as mock_dr,
-        ):
-            # Setup entity registry with temperature sensor
-            mock_entity = MagicMock()
-            mock_entity.domain = "sensor"
-            mock_entity.entity_id = "sensor.temperature_bureau"
-            mock_entity.area_id = "bureau"
-            mock_entity.device_id = None
+    def test_get_climate_entities_for_empty_area(self, registries):
+        """Test that no registry lookup happens without an area."""
+        with _patch_area_indices([], [], {}) as (entries_for_area, _, _):
+            result = _get_climate_entities_for_area(*registries, "")
 
-            mock_er.return_value.entities.values.return_value = [mock_entity]
-            mock_dr.return_value.async_get.return_value = None
+        assert result == []
+        entries_for_area.assert_not_called()
 
-            result = _get_temperature_sensors_for_area(mock_hass, "bureau")
+    def test_get_temperature_sensors_for_area_direct(self, registries):
+        """Test getting temperature sensors directly assigned to area."""
+        direct = [self._entry("sensor", "sensor.temperature_bureau", "temperature")]
+        with _patch_area_indices(direct, [], {}):
+            result = _get_temperature_sensors_for_area(*registries, "bureau")
 
-            assert result == ["sensor.temperature_bureau"]
+        assert result == ["sensor.temperature_bureau"]
 
-    def test_get_temperature_sensors_for_area_via_device(self, mock_hass):
+    def test_get_temperature_sensors_for_area_via_device(self, registries):
         """Test getting temperature sensors via device area."""
-        with (
-            patch("custom_components.chauffage_intelligent.config_flow.er.async_get") as mock_er,
-            patch("homeassistant.helpers.device_registry.async_get") as mock_dr,
-        ):
-            # Setup entity registry with sensor (no direct area)
-            mock_entity = MagicMock()
-            mock_entity.domain = "sensor"
-            mock_entity.entity_id = "sensor.temperature_salon"
-            mock_entity.area_id = None
-            mock_entity.device_id = "device_456"
-
-            mock_er.return_value.entities.values.return_value = [mock_entity]
+        mock_device = MagicMock()
+        mock_device.id = "device_456"
+        device_entries = {
+            "device_456": [self._entry("sensor", "sensor.temperature_salon", "temperature")]
+        }
+        with _patch_area_indices([], [mock_device], device_entries):
+            result = _get_temperature_sensors_for_area(*registries, "salon")
 
-            # Setup device in area
-            mock_device = MagicMock()
-            mock_device.area_id = "salon"
-            mock_dr.return_value.async_get.return_value = mock_device
+        assert result == ["sensor.temperature_salon"]
 
-            result = _get_temperature_sensors_for_area(mock_hass, "salon")
+    def test_get_temperature_sensors_uses_user_device_class(self, registries):
+        """Test that a device class set by the user overrides the original one."""
+        entry = self._entry("sensor", "sensor.probe_bureau", "voltage")
+        entry.device_class = "temperature"
+        with _patch_area_indices([entry], [], {}):
+            result = _get_temperature_sensors_for_area(*registries, "bureau")
 
-            assert result == ["sensor.temperature_salon"]
+        assert result == ["sensor.probe_bureau"]
 
-    def test_get_temperature_sensors_excludes_non_temperature(self, mock_hass):
+    def test_get_temperature_sensors_excludes_non_temperature(self, registries):
         """Test that non-temperature sensors are excluded."""
-        with (
-            patch("custom_components.chauffage_intelligent.config_flow.er.async_get") as mock_er,
-            patch("homeassistant.helpers.device_registry.async_get") as mock_dr,
-        ):
-            # Setup entity registry with humidity sensor
-            mock_entity = MagicMock()
-            mock_entity.domain = "sensor"
-            mock_entity.entity_id = "sensor.humidity_bureau"
-            mock_entity.area_id = "bureau"
-            mock_entity.device_id = None
-
-            mock_er.return_value.entities.values.return_value = [mock_entity]
-            mock_dr.return_value.async_get.return_value = None
-
-            result = _get_temperature_sensors_for_area(mock_hass, "bureau")
-
-            assert result == []
+        direct = [self._entry("sensor", "sensor.humidity_bureau", "humidity")]
+        with _patch_area_indices(direct, [], {}):
+            result = _get_temperature_sensors_for_area(*registries, "bureau")
+
+        assert result == []
+
+    def test_get_all_temperature_sensors(self, mock_hass):
+        """Test listing temperature sensors from the registry and the state machine."""
+        entries = {
+            "sensor.temperature_bureau": self._entry(
+                "sensor", "sensor.temperature_bureau", "temperature"
+            ),
+            "sensor.humidity_bureau": self._entry("sensor", "sensor.humidity_bureau", "humidity"),
+        }
+        legacy_state = MagicMock()
+        legacy_state.attributes = {"device_class": "temperature"}
+        mock_hass.states.async_entity_ids.return_value = [
+            "sensor.temperature_bureau",
+            "sensor.humidity_bureau",
+            "sensor.legacy_temperature",
+        ]
+        mock_hass.states.get = {"sensor.legacy_temperature": legacy_state}.get
+        entity_reg = MagicMock()
+        entity_reg.async_get = entries.get
+
+        result = _get_all_temperature_sensors(mock_hass, entity_reg)
+
+        mock_hass.states.async_entity_ids.assert_called_once_with("sensor")
+        assert result == ["sensor.temperature_bureau", "sensor.legacy_temperature"]
+
+
+    def test_entity_dropdown_shared_for_same_entities(self):
+        """Test that renders offering the same entities share one selector."""
+        first = _entity_dropdown(("climate.bureau", "climate.salon"), multiple=True)
+
+        assert _entity_dropdown(("climate.bureau", "climate.salon"), multiple=True) is first
+        assert _entity_dropdown(("climate.bureau",), multiple=True) is not first
+        assert first.config["multiple"] is True
+
+    def test_build_room_schema_defaults(self):
+        """Test that the room schema only pre-fills the given values."""
+        new_room = {str(key): key for key in _build_room_schema([], []).schema}
+        assert new_room[CONF_PIECE_TYPE].default is vol.UNDEFINED
+        assert new_room[CONF_PIECE_RADIATEURS].default is vol.UNDEFINED
+        assert new_room["temp_confort"].default() == 19
+
+        schema = _build_room_schema(
+            ["climate.bureau"], [], piece_type="bureau", radiateurs=["climate.bureau"], temp_eco=16
+        )
+        existing = {str(key): key for key in schema.schema}
+        assert existing[CONF_PIECE_TYPE].default() == "bureau"
+        assert existing[CONF_PIECE_RADIATEURS].default() == ["climate.bureau"]
+        assert existing["temp_eco"].default() == 16
 
 
 class TestConfigFlowSelectArea:
@@ -706,6 +802,49 @@ class TestConfigFlowSelectArea:
             assert flow._current_area_id == "salon"
             assert flow._current_area_name == "Salon"
 
+    def test_all_temperature_sensors_cached_per_flow(self, mock_hass):
+        """Test that the temperature sensor fallback is computed once per flow."""
+        flow = ChauffageIntelligentConfigFlow()
+        flow.hass = mock_hass
+
+        with (
+            patch("custom_components.chauffage_intelligent.config_flow.er.async_get"),
+            patch("custom_components.chauffage_intelligent.config_flow.dr.async_get"),
+            patch(
+                "custom_components.chauffage_intelligent.config_flow._get_all_temperature_sensors",
+                return_value=["sensor.temperature_salon"],
+            ) as mock_sensors,
+        ):
+            assert flow._temperature_sensors_for_area("") == []
+            assert flow._all_temperature_sensors() == ["sensor.temperature_salon"]
+            assert flow._all_temperature_sensors() == ["sensor.temperature_salon"]
+
+            mock_sensors.assert_called_once()
+
+    def test_registries_resolved_once_per_flow(self, mock_hass):
+        """Test that the entity and device registries are shared across lookups."""
+        flow = ChauffageIntelligentConfigFlow()
+        flow.hass = mock_hass
+
+        with (
+            patch("custom_components.chauffage_intelligent.config_flow.er.async_get") as mock_er,
+            patch("custom_components.chauffage_intelligent.config_flow.dr.async_get") as mock_dr,
+            patch(
+                "custom_components.chauffage_intelligent.config_flow._get_climate_entities_for_area"
+            ) as mock_climate,
+            patch(
+                "custom_components.chauffage_intelligent.config_flow._get_temperature_sensors_for_area"
+            ) as mock_sensors,
+        ):
+            flow._climate_entities_for_area("salon")
+            flow._temperature_sensors_for_area("salon")
+
+            mock_er.assert_called_once_with(mock_hass)
+            mock_dr.assert_called_once_with(mock_hass)
+            registries = (mock_er.return_value, mock_dr.return_value)
+            mock_climate.assert_called_once_with(*registries, "salon")
+            mock_sensors.assert_called_once_with(*registries, "salon")
+
     @pytest.mark.asyncio
     async def test_async_step_select_area_shows_form(self, mock_hass):
         """Test select_area shows form when no input."""
@@ -751,6 +890,27 @@ class TestConfigFlowSelectArea:
             assert result["type"] == "form"
             assert result["errors"]["base"] == "no_areas_available"
 
+    @pytest.mark.asyncio
+    async def test_async_step_select_area_reuses_registry_lookup(self, mock_hass):
+        """Test that areas are looked up once per flow across renders."""
+        flow = ChauffageIntelligentConfigFlow()
+        flow.hass = mock_hass
+        flow._data = {
+            CONF_CALENDAR: "calendar.google_home",
+            CONF_PRESENCE_TRACKERS: ["device_tracker.phone"],
+            CONF_PIECES: {},
+        }
+
+        with patch(
+            "custom_components.chauffage_intelligent.config_flow._get_areas_with_climate"
+        ) as mock_areas:
+            mock_areas.return_value = [{"value": "salon", "label": "Salon"}]
+
+            await flow.async_step_select_area(None)
+            await flow.async_step_select_area(None)
+
+            mock_areas.assert_called_once_with(mock_hass)
+
 
 class TestConfigFlowConfigureRoom:
     """Test ConfigFlow configure_room step."""
@@ -901,7 +1061,7 @@ class TestOptionsFlowAddRoom:
             assert result["type"] == "create_entry"
             assert "salon" in flow._data[CONF_PIECES]
             mock_hass.config_entries.async_update_entry.assert_called_once()
-            mock_hass.config_entries.async_reload.assert_called_once()
+            mock_hass.config_entries.async_reload.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_step_add_room_string_radiateur(self, mock_config_entry, mock_hass):
@@ -975,7 +1135,9 @@ class TestOptionsFlowSelectAndModifyRoom:
             "climate": [climate_state],
             "sensor": [sensor_state],
         }
-        hass.states.async_all = lambda domain: domain_states.get(domain, [])
+        hass.states.async_entity_ids = lambda domain: [
+            state.entity_id for state in domain_states.get(domain, [])
+        ]
         hass.config_entries.async_update_entry = MagicMock()
         hass.config_entries.async_reload = AsyncMock()
         return hass
@@ -1096,7 +1258,7 @@ class TestOptionsFlowSelectAndModifyRoom:
             assert result["type"] == "create_entry"
             assert flow._data[CONF_PIECES]["bureau"][CONF_PIECE_TEMPERATURES][MODE_CONFORT] == 21
             mock_hass.config_entries.async_update_entry.assert_called_once()
-            mock_hass.config_entries.async_reload.assert_called_once()
+            mock_hass.config_entries.async_reload.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_step_modify_room_string_radiateur(self, mock_config_entry, mock_hass):
@@ -1222,7 +1384,41 @@ class TestOptionsFlowDeleteRoom:
             assert result["type"] == "create_entry"
             assert "bureau" not in flow._data[CONF_PIECES]
             mock_hass.config_entries.async_update_entry.assert_called_once()
-            mock_hass.config_entries.async_reload.assert_called_once()
+            mock_hass.config_entries.async_reload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_step_delete_room_keeps_entry_data(self, mock_config_entry, mock_hass):
+        """Test delete_room does not mutate the config entry data in place."""
+        with patch.object(
+            ChauffageIntelligentOptionsFlow,
+            "config_entry",
+            new_callable=lambda: property(lambda self: mock_config_entry),
+        ):
+            flow = ChauffageIntelligentOptionsFlow(mock_config_entry)
+            flow.hass = mock_hass
+
+            await flow.async_step_delete_room({"room": "bureau", "confirm": True})
+
+            assert "bureau" in mock_config_entry.data[CONF_PIECES]
+            assert "bureau" not in flow._data[CONF_PIECES]
+
+    @pytest.mark.asyncio
+    async def test_async_step_delete_room_already_removed(self, mock_config_entry, mock_hass):
+        """Test delete_room skips the reload when the room no longer exists."""
+        with patch.object(
+            ChauffageIntelligentOptionsFlow,
+            "config_entry",
+            new_callable=lambda: property(lambda self: mock_config_entry),
+        ):
+            flow = ChauffageIntelligentOptionsFlow(mock_config_entry)
+            flow.hass = mock_hass
+
+            result = await flow.async_step_delete_room({"room": "salon", "confirm": True})
+
+            assert result["type"] == "create_entry"
+            assert "bureau" in flow._data[CONF_PIECES]
+            mock_hass.config_entries.async_update_entry.assert_not_called()
+            mock_hass.config_entries.async_reload.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_step_delete_room_cancels(self, mock_config_entry, mock_hass):
@@ -1284,7 +1480,9 @@ class TestOptionsFlowSettings:
             "calendar": [calendar_state, calendar_state2],
             "device_tracker": [tracker_state, tracker_state2],
         }
-        hass.states.async_all = lambda domain: domain_states.get(domain, [])
+        hass.states.async_entity_ids = lambda domain: [
+            state.entity_id for state in domain_states.get(domain, [])
+        ]
         hass.config_entries.async_update_entry = MagicMock()
         hass.config_entries.async_reload = AsyncMock()
         return hass
@@ -1305,6 +1503,39 @@ class TestOptionsFlowSettings:
             assert result["type"] == "form"
             assert result["step_id"] == "settings"
 
+    @pytest.mark.asyncio
+    async def test_async_step_settings_lists_entities_once(self, mock_config_entry, mock_hass):
+        """Test calendars and trackers are listed once per flow."""
+        with patch.object(
+            ChauffageIntelligentOptionsFlow,
+            "config_entry",
+            new_callable=lambda: property(lambda self: mock_config_entry),
+        ):
+            flow = ChauffageIntelligentOptionsFlow(mock_config_entry)
+            flow.hass = mock_hass
+            mock_hass.states.async_entity_ids = MagicMock(return_value=[])
+
+            await flow.async_step_settings(None)
+            await flow.async_step_settings(None)
+
+            assert mock_hass.states.async_entity_ids.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_step_settings_sorts_entities(self, mock_config_entry, mock_hass):
+        """Test calendars are offered in alphabetical order."""
+        with patch.object(
+            ChauffageIntelligentOptionsFlow,
+            "config_entry",
+            new_callable=lambda: property(lambda self: mock_config_entry),
+        ):
+            flow = ChauffageIntelligentOptionsFlow(mock_config_entry)
+            flow.hass = mock_hass
+            mock_hass.states.async_entity_ids = lambda domain: ["calendar.work", "calendar.home"]
+
+            await flow.async_step_settings(None)
+
+            assert flow._entity_ids("calendar") == ["calendar.home", "calendar.work"]
+
     @pytest.mark.asyncio
     async def test_async_step_settings_submits(self, mock_config_entry, mock_hass):
         """Test settings updates config entry."""
@@ -1336,7 +1567,7 @@ class TestOptionsFlowSettings:
             assert flow._data[CONF_SECURITY_FACTOR] == 1.5
             assert flow._data[CONF_MIN_PREHEAT_TIME] == 45
             mock_hass.config_entries.async_update_entry.assert_called_once()
-            mock_hass.config_entries.async_reload.assert_called_once()
+            mock_hass.config_entries.async_reload.assert_not_called()
 
 
 class TestOptionsFlowSelectAreaForAdd:
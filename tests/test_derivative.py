@@ -1,6 +1,7 @@
 """Tests for temperature derivative (heating rate) calculation."""
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
@@ -59,9 +60,7 @@ class TestDerivativeCalculation:
         now = datetime.now()
 
         # Add old reading (45 minutes ago, outside default 30-minute window)
-        coordinator._temp_history["bureau"] = [
-            (now - timedelta(minutes=45), 15.0)
-        ]
+        coordinator._temp_history["bureau"] = deque([(now - timedelta(minutes=45), 15.0)])
 
         # Add reading 20 minutes ago
         with patch("homeassistant.util.dt.now", return_value=now - timedelta(minutes=20)):
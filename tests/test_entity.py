@@ -0,0 +1,161 @@
+"""Tests for the base room entity and active room tracking."""
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.chauffage_intelligent.const import MODE_CONFORT, SOURCE_ANTICIPATION
+from custom_components.chauffage_intelligent.entity import ChauffageIntelligentPieceEntity
+
+
+class TestChauffageIntelligentPieceEntity:
+    """Test ChauffageIntelligentPieceEntity."""
+
+    def test_initialization(self, coordinator):
+        """Test the entity keeps its room id."""
+        entity = ChauffageIntelligentPieceEntity(coordinator, "bureau")
+
+        assert entity._piece_id == "bureau"
+        assert entity.coordinator is coordinator
+
+    @pytest.mark.asyncio
+    async def test_added_to_hass_registers_active_piece(self, coordinator):
+        """Test that adding the entity marks its room active until removal."""
+        entity = ChauffageIntelligentPieceEntity(coordinator, "bureau")
+
+        await entity.async_added_to_hass()
+        assert coordinator._active_pieces == {"bureau": 1}
+
+        for remove in entity._on_remove:
+            remove()
+        assert coordinator._active_pieces == {}
+
+
+class TestActivePieces:
+    """Test active room tracking in the coordinator."""
+
+    def test_all_pieces_active_without_registration(self, coordinator):
+        """Test that every room is active before any entity is added."""
+        assert all(coordinator._is_piece_active(piece_id) for piece_id in coordinator.pieces)
+
+    def test_only_registered_pieces_active(self, coordinator):
+        """Test that rooms without enabled entities are inactive."""
+        coordinator.async_register_active_piece("salon")
+
+        assert coordinator._is_piece_active("salon") is True
+        assert coordinator._is_piece_active("bureau") is False
+
+    @pytest.mark.asyncio
+    async def test_inactive_piece_still_heated(self, coordinator, mock_hass):
+        """Test that rooms without enabled entities keep receiving their setpoint."""
+        mock_hass.states.get.return_value = None
+        mock_hass.services.async_call.return_value = {}
+        coordinator._learner.loaded = True
+        coordinator.async_register_active_piece("salon")
+
+        data = await coordinator._async_update_data()
+
+        written = {
+            call.args[2]["entity_id"] for call in mock_hass.services.async_call.call_args_list
+            if call.args[1] == "set_temperature"
+        }
+        assert written == {"climate.bilbao_bureau", "climate.bilbao_salon", "climate.bilbao_chambre"}
+        assert data["pieces"]["bureau"]["consigne"] == 17
+        assert data["pieces"]["bureau"]["learning_samples"] is None
+        assert data["pieces"]["salon"]["learning_samples"] == 0
+        assert "bureau" not in coordinator._temp_history
+
+    @pytest.mark.asyncio
+    async def test_inactive_piece_still_preheats(
+        self, coordinator, mock_hass, mock_state, calendar_event_factory
+    ):
+        """Test that rooms without enabled entities still switch to comfort ahead of events."""
+        states = {
+            "device_tracker.phone_1": mock_state("home"),
+            "sensor.temperature_bureau": mock_state("16.0"),
+        }
+        mock_hass.states.get.side_effect = states.get
+        event = calendar_event_factory(
+            "Confort Bureau", start=dt_util.now() + timedelta(minutes=10)
+        )
+        mock_hass.services.async_call.return_value = {
+            coordinator.calendar_entity: {"events": [event]}
+        }
+        coordinator._learner.loaded = True
+        coordinator.async_register_active_piece("salon")
+
+        data = await coordinator._async_update_data()
+
+        bureau = data["pieces"]["bureau"]
+        assert bureau["temperature"] == 16.0
+        assert bureau["prechauffage_actif"] is True
+        assert (bureau["mode"], bureau["source"]) == (MODE_CONFORT, SOURCE_ANTICIPATION)
+        mock_hass.services.async_call.assert_any_await(
+            "climate",
+            "set_temperature",
+            {"entity_id": "climate.bilbao_bureau", "temperature": 19},
+            blocking=True,
+        )
+
+    def test_piece_stays_active_until_last_entity_removed(self, coordinator):
+        """Test that a room is active while any of its entities remains."""
+        unregister_climate = coordinator.async_register_active_piece("bureau")
+        unregister_sensor = coordinator.async_register_active_piece("bureau")
+
+        unregister_climate()
+        assert coordinator._active_pieces == {"bureau": 1}
+
+        unregister_sensor()
+        assert coordinator._active_pieces == {}
+
+
+class TestPieceData:
+    """Test the coordinator room data lookup used by entities."""
+
+    def test_returns_none_without_data(self, coordinator):
+        """Test that no room data is returned before the first refresh."""
+        coordinator.data = None
+
+        assert coordinator.piece_data("bureau") is None
+
+    def test_returns_room_data(self, coordinator):
+        """Test that the computed data of a room is returned."""
+        coordinator.data = {"pieces": {"bureau": {"mode": "eco"}}}
+
+        assert coordinator.piece_data("bureau") == {"mode": "eco"}
+        assert coordinator.piece_data("salon") is None
+
+
+class TestAvailability:
+    """Test availability of room entities."""
+
+    def test_available_before_first_refresh(self, coordinator):
+        """Test that the entity is available while waiting for data."""
+        coordinator.data = None
+        entity = ChauffageIntelligentPieceEntity(coordinator, "bureau")
+
+        assert entity.available is True
+
+    def test_unavailable_when_room_missing(self, coordinator):
+        """Test that the entity is unavailable when its room has no data."""
+        coordinator.data = {"pieces": {}}
+        entity = ChauffageIntelligentPieceEntity(coordinator, "bureau")
+
+        assert entity.available is False
+
+    def test_availability_follows_coordinator_updates(self, coordinator):
+        """Test that availability is refreshed on coordinator updates only."""
+        coordinator.data = {"pieces": {"bureau": {"mode": "eco"}}}
+        entity = ChauffageIntelligentPieceEntity(coordinator, "bureau")
+        entity.async_write_ha_state = MagicMock()
+        assert entity.available is True
+
+        coordinator.last_update_success = False
+        assert entity.available is True
+
+        entity._handle_coordinator_update()
+        assert entity.available is False
+        entity.async_write_ha_state.assert_called_once()
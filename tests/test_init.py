@@ -4,9 +4,12 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import voluptuous as vol
 
 from custom_components.chauffage_intelligent import (
+    SET_MODE_SCHEMA,
     _async_setup_services,
+    _async_update_listener,
     async_setup_entry,
     async_unload_entry,
 )
@@ -26,6 +29,7 @@ def mock_hass():
     hass.data = {}
     hass.services = MagicMock()
     hass.services.async_register = MagicMock()
+    hass.services.has_service = MagicMock(return_value=False)
     hass.config_entries = MagicMock()
     hass.config_entries.async_forward_entry_setups = AsyncMock()
     hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
@@ -60,7 +64,6 @@ class TestAsyncSetupEntry:
             "custom_components.chauffage_intelligent.ChauffageIntelligentCoordinator"
         ) as mock_coordinator_class:
             mock_coordinator = MagicMock()
-            mock_coordinator.async_config_entry_first_refresh = AsyncMock()
             mock_coordinator_class.return_value = mock_coordinator
 
             with patch(
@@ -72,6 +75,7 @@ class TestAsyncSetupEntry:
         assert result is True
         assert DOMAIN in mock_hass.data
         assert mock_config_entry.entry_id in mock_hass.data[DOMAIN]
+        mock_config_entry.add_update_listener.assert_called_once_with(_async_update_listener)
 
     @pytest.mark.asyncio
     async def test_setup_entry_creates_coordinator(self, mock_hass, mock_config_entry):
@@ -80,7 +84,6 @@ class TestAsyncSetupEntry:
             "custom_components.chauffage_intelligent.ChauffageIntelligentCoordinator"
         ) as mock_coordinator_class:
             mock_coordinator = MagicMock()
-            mock_coordinator.async_config_entry_first_refresh = AsyncMock()
             mock_coordinator_class.return_value = mock_coordinator
 
             with patch(
@@ -100,7 +103,6 @@ class TestAsyncSetupEntry:
             "custom_components.chauffage_intelligent.ChauffageIntelligentCoordinator"
         ) as mock_coordinator_class:
             mock_coordinator = MagicMock()
-            mock_coordinator.async_config_entry_first_refresh = AsyncMock()
             mock_coordinator_class.return_value = mock_coordinator
 
             with patch(
@@ -112,6 +114,98 @@ class TestAsyncSetupEntry:
         mock_hass.config_entries.async_forward_entry_setups.assert_called_once()
 
 
+    @pytest.mark.asyncio
+    async def test_setup_entry_refreshes_in_background(self, mock_hass, mock_config_entry):
+        """Test that the first refresh does not block the setup."""
+        with patch(
+            "custom_components.chauffage_intelligent.ChauffageIntelligentCoordinator"
+        ) as mock_coordinator_class:
+            mock_coordinator = MagicMock()
+            mock_coordinator_class.return_value = mock_coordinator
+
+            with patch(
+                "custom_components.chauffage_intelligent._async_setup_services",
+                new_callable=AsyncMock,
+            ):
+                await async_setup_entry(mock_hass, mock_config_entry)
+
+        mock_coordinator.async_config_entry_first_refresh.assert_not_called()
+        mock_config_entry.async_create_background_task.assert_called_once()
+        assert (
+            mock_config_entry.async_create_background_task.call_args[0][1]
+            is mock_coordinator.async_refresh.return_value
+        )
+
+    @pytest.mark.asyncio
+    async def test_setup_entry_registers_services(self, mock_hass, mock_config_entry):
+        """Test that setup registers services alongside platform setup."""
+        with patch(
+            "custom_components.chauffage_intelligent.ChauffageIntelligentCoordinator"
+        ) as mock_coordinator_class:
+            mock_coordinator = MagicMock()
+            mock_coordinator_class.return_value = mock_coordinator
+
+            with patch(
+                "custom_components.chauffage_intelligent._async_setup_services",
+                new_callable=AsyncMock,
+            ) as mock_setup_services:
+                await async_setup_entry(mock_hass, mock_config_entry)
+
+        mock_setup_services.assert_awaited_once_with(mock_hass)
+
+    @pytest.mark.asyncio
+    async def test_setup_entry_skips_registered_services(self, mock_hass, mock_config_entry):
+        """Test that services are not registered again by a second entry."""
+        mock_hass.services.has_service.return_value = True
+
+        with patch(
+            "custom_components.chauffage_intelligent.ChauffageIntelligentCoordinator"
+        ) as mock_coordinator_class:
+            mock_coordinator = MagicMock()
+            mock_coordinator_class.return_value = mock_coordinator
+
+            with patch(
+                "custom_components.chauffage_intelligent._async_setup_services",
+                new_callable=AsyncMock,
+            ) as mock_setup_services:
+                await async_setup_entry(mock_hass, mock_config_entry)
+
+        mock_setup_services.assert_not_called()
+
+class TestUpdateListener:
+    """Test the config entry update listener."""
+
+    @pytest.mark.asyncio
+    async def test_settings_applied_without_reload(self, mock_hass, mock_config_entry):
+        """Test that tunable changes refresh the coordinator instead of reloading."""
+        coordinator = MagicMock()
+        coordinator.async_update_settings.return_value = True
+        coordinator.async_request_refresh = AsyncMock()
+        mock_hass.config_entries.async_reload = AsyncMock()
+        mock_hass.data[DOMAIN] = {mock_config_entry.entry_id: coordinator}
+
+        await _async_update_listener(mock_hass, mock_config_entry)
+
+        coordinator.async_request_refresh.assert_awaited_once()
+        mock_hass.config_entries.async_reload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_structural_change_reloads(self, mock_hass, mock_config_entry):
+        """Test that room or source changes reload the entry."""
+        coordinator = MagicMock()
+        coordinator.async_update_settings.return_value = False
+        coordinator.async_request_refresh = AsyncMock()
+        mock_hass.config_entries.async_reload = AsyncMock()
+        mock_hass.data[DOMAIN] = {mock_config_entry.entry_id: coordinator}
+
+        await _async_update_listener(mock_hass, mock_config_entry)
+
+        mock_hass.config_entries.async_reload.assert_awaited_once_with(
+            mock_config_entry.entry_id
+        )
+        coordinator.async_request_refresh.assert_not_called()
+
+
 class TestAsyncUnloadEntry:
     """Test async_unload_entry function."""
 
@@ -148,16 +242,48 @@ class TestAsyncUnloadEntry:
         # Entry should still be in data since unload failed
         assert mock_config_entry.entry_id in mock_hass.data[DOMAIN]
 
+    @pytest.mark.asyncio
+    async def test_unload_last_entry_removes_services(self, mock_hass, mock_config_entry):
+        """Test that unloading the last entry removes the services."""
+        mock_hass.data[DOMAIN] = {mock_config_entry.entry_id: MagicMock()}
+
+        await async_unload_entry(mock_hass, mock_config_entry)
+
+        assert mock_hass.services.async_remove.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_unload_entry_keeps_services_for_other_entries(
+        self, mock_hass, mock_config_entry
+    ):
+        """Test that services stay registered while other entries remain."""
+        mock_hass.data[DOMAIN] = {
+            mock_config_entry.entry_id: MagicMock(),
+            "other_entry_id": MagicMock(),
+        }
+
+        await async_unload_entry(mock_hass, mock_config_entry)
+
+        mock_hass.services.async_remove.assert_not_called()
+
 
 class TestAsyncSetupServices:
     """Test _async_setup_services function."""
 
+    @pytest.fixture
+    def mock_coordinator(self, mock_hass):
+        """Register a mock coordinator managing the bureau room."""
+        coordinator = MagicMock()
+        coordinator.pieces = {"bureau": {}}
+        coordinator.async_set_mode_override = AsyncMock()
+        coordinator.async_reset_mode_override = AsyncMock()
+        coordinator.async_request_refresh = AsyncMock()
+        mock_hass.data[DOMAIN] = {"test_entry_id": coordinator}
+        return coordinator
+
     @pytest.mark.asyncio
     async def test_services_registered(self, mock_hass):
         """Test that services are registered."""
-        mock_coordinator = MagicMock()
-
-        await _async_setup_services(mock_hass, mock_coordinator)
+        await _async_setup_services(mock_hass)
 
         assert mock_hass.services.async_register.call_count == 3
         registered_services = [
@@ -168,12 +294,9 @@ class TestAsyncSetupServices:
         assert "refresh" in registered_services
 
     @pytest.mark.asyncio
-    async def test_set_mode_handler_valid_mode(self, mock_hass):
+    async def test_set_mode_handler_valid_mode(self, mock_hass, mock_coordinator):
         """Test set_mode handler with valid mode."""
-        mock_coordinator = MagicMock()
-        mock_coordinator.async_set_mode_override = AsyncMock()
-
-        await _async_setup_services(mock_hass, mock_coordinator)
+        await _async_setup_services(mock_hass)
 
         # Get the set_mode handler
         set_mode_handler = mock_hass.services.async_register.call_args_list[0][0][2]
@@ -189,32 +312,28 @@ class TestAsyncSetupServices:
         )
 
     @pytest.mark.asyncio
-    async def test_set_mode_handler_invalid_mode(self, mock_hass):
-        """Test set_mode handler with invalid mode."""
-        mock_coordinator = MagicMock()
-        mock_coordinator.async_set_mode_override = AsyncMock()
-
-        await _async_setup_services(mock_hass, mock_coordinator)
+    async def test_set_mode_registered_with_schema(self, mock_hass):
+        """Test set_mode is registered with its validation schema."""
+        await _async_setup_services(mock_hass)
 
-        # Get the set_mode handler
-        set_mode_handler = mock_hass.services.async_register.call_args_list[0][0][2]
+        set_mode_call = mock_hass.services.async_register.call_args_list[0]
+        assert set_mode_call.kwargs["schema"] is SET_MODE_SCHEMA
 
-        # Create mock service call with invalid mode
-        mock_call = MagicMock()
-        mock_call.data = {"piece": "bureau", "mode": "invalid_mode"}
+    def test_set_mode_schema_rejects_invalid_mode(self):
+        """Test set_mode schema rejects an invalid mode."""
+        with pytest.raises(vol.Invalid):
+            SET_MODE_SCHEMA({"piece": "bureau", "mode": "invalid_mode"})
 
-        await set_mode_handler(mock_call)
+    def test_set_mode_schema_coerces_duration(self):
+        """Test set_mode schema accepts a valid call and coerces the duration."""
+        data = SET_MODE_SCHEMA({"piece": "bureau", "mode": MODE_CONFORT, "duree": "60"})
 
-        # Should not call coordinator for invalid mode
-        mock_coordinator.async_set_mode_override.assert_not_called()
+        assert data == {"piece": "bureau", "mode": MODE_CONFORT, "duree": 60}
 
     @pytest.mark.asyncio
-    async def test_reset_mode_handler(self, mock_hass):
+    async def test_reset_mode_handler(self, mock_hass, mock_coordinator):
         """Test reset_mode handler."""
-        mock_coordinator = MagicMock()
-        mock_coordinator.async_reset_mode_override = AsyncMock()
-
-        await _async_setup_services(mock_hass, mock_coordinator)
+        await _async_setup_services(mock_hass)
 
         # Get the reset_mode handler
         reset_mode_handler = mock_hass.services.async_register.call_args_list[1][0][2]
@@ -228,12 +347,9 @@ class TestAsyncSetupServices:
         mock_coordinator.async_reset_mode_override.assert_called_once_with("bureau")
 
     @pytest.mark.asyncio
-    async def test_refresh_handler(self, mock_hass):
+    async def test_refresh_handler(self, mock_hass, mock_coordinator):
         """Test refresh handler."""
-        mock_coordinator = MagicMock()
-        mock_coordinator.async_request_refresh = AsyncMock()
-
-        await _async_setup_services(mock_hass, mock_coordinator)
+        await _async_setup_services(mock_hass)
 
         # Get the refresh handler
         refresh_handler = mock_hass.services.async_register.call_args_list[2][0][2]
@@ -243,4 +359,47 @@ class TestAsyncSetupServices:
 
         await refresh_handler(mock_call)
 
+        mock_coordinator.async_invalidate_calendar.assert_called_once()
         mock_coordinator.async_request_refresh.assert_called_once()
+        mock_hass.async_create_background_task.assert_called_once()
+        mock_hass.async_create_background_task.call_args[0][0].close()
+
+    @pytest.mark.asyncio
+    async def test_refresh_handler_does_not_await_refresh(self, mock_hass, mock_coordinator):
+        """Test refresh handler schedules the refresh instead of awaiting it."""
+        await _async_setup_services(mock_hass)
+
+        refresh_handler = mock_hass.services.async_register.call_args_list[2][0][2]
+
+        await refresh_handler(MagicMock())
+
+        mock_coordinator.async_request_refresh.assert_not_awaited()
+        mock_hass.async_create_background_task.call_args[0][0].close()
+
+    @pytest.mark.asyncio
+    async def test_set_mode_handler_unknown_piece(self, mock_hass, mock_coordinator):
+        """Test set_mode handler with a room no entry manages."""
+        await _async_setup_services(mock_hass)
+
+        set_mode_handler = mock_hass.services.async_register.call_args_list[0][0][2]
+
+        mock_call = MagicMock()
+        mock_call.data = {"piece": "grenier", "mode": MODE_CONFORT}
+
+        await set_mode_handler(mock_call)
+
+        mock_coordinator.async_set_mode_override.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reset_mode_handler_all_rooms(self, mock_hass, mock_coordinator):
+        """Test reset_mode handler without a room resets every entry."""
+        await _async_setup_services(mock_hass)
+
+        reset_mode_handler = mock_hass.services.async_register.call_args_list[1][0][2]
+
+        mock_call = MagicMock()
+        mock_call.data = {}
+
+        await reset_mode_handler(mock_call)
+
+        mock_coordinator.async_reset_mode_override.assert_called_once_with()
@@ -1,36 +1,51 @@
 """Tests for heating rate learning."""
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
-from unittest.mock import MagicMock
+import json
+from datetime import UTC, datetime
+from unittest.mock import ANY, AsyncMock, MagicMock
 
 import pytest
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CoreState
+from homeassistant.helpers.storage import STORAGE_DIR
 
 from custom_components.chauffage_intelligent.coordinator import (
+    LEARNING_MAX_SAMPLES,
     LEARNING_MIN_SAMPLES,
+    LEARNING_SAVE_DELAY,
+    LEARNING_STORAGE_KEY,
+    LEGACY_LEARNING_FILE,
     HeatingRateLearner,
+    _time_period,
 )
 
 
 @pytest.fixture
-def temp_storage_path():
-    """Create a temporary storage path for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir) / "test_learned_rates.json"
+def mock_hass(tmp_path):
+    """Create a mock Home Assistant instance able to back a real Store."""
+    hass = MagicMock()
+    hass.data = {}
+    hass.state = CoreState.running
+    hass.config.config_dir = str(tmp_path)
+    hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
+    hass.loop.time.return_value = 0.0
+    hass.loop.call_at.return_value.when.return_value = LEARNING_SAVE_DELAY
+    # Run executor jobs inline
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    return hass
 
 
 @pytest.fixture
-def mock_hass():
-    """Create a mock Home Assistant instance."""
-    hass = MagicMock()
-    return hass
+def store_path(tmp_path):
+    """Return the path of the learned data store."""
+    return tmp_path / STORAGE_DIR / LEARNING_STORAGE_KEY
 
 
 @pytest.fixture
-def learner(mock_hass, temp_storage_path):
+def learner(mock_hass):
     """Create a HeatingRateLearner instance for testing."""
-    return HeatingRateLearner(mock_hass, temp_storage_path)
+    return HeatingRateLearner(mock_hass)
 
 
 class TestHeatingRateLearner:
@@ -50,6 +65,17 @@ class TestHeatingRateLearner:
         assert stats["samples"] == 1
         assert stats["avg_rate"] == 1.5
 
+    def test_observation_timestamp_is_epoch_seconds(self, learner):
+        """Test that observations store a compact integer timestamp."""
+        now = datetime(2024, 1, 15, 8, 30, tzinfo=UTC)
+
+        learner.record_observation("bureau", 1.5, now=now)
+
+        (observation,) = learner._data["bureau"]
+        assert observation["ts"] == int(now.timestamp())
+        assert observation["hour"] == 8
+        assert "timestamp" not in observation
+
     def test_ignore_too_low_rate(self, learner):
         """Test that very low heating rates are ignored."""
         learner.record_observation("bureau", 0.1, outdoor_temp=5.0, hour=10)
@@ -127,18 +153,79 @@ class TestHeatingRateLearner:
 
         assert warm_prediction > cold_prediction
 
-    def test_data_persistence(self, mock_hass, temp_storage_path):
+    @pytest.mark.asyncio
+    async def test_data_persistence(self, mock_hass):
         """Test that learned data is persisted and reloaded."""
         # Create learner and add data
-        learner1 = HeatingRateLearner(mock_hass, temp_storage_path)
+        learner1 = HeatingRateLearner(mock_hass)
         for _ in range(5):
             learner1.record_observation("bureau", 1.5, hour=10)
+        await learner1.async_flush()
 
         # Create new learner instance that should load persisted data
-        learner2 = HeatingRateLearner(mock_hass, temp_storage_path)
+        learner2 = HeatingRateLearner(mock_hass)
+        await learner2.async_load()
 
         stats = learner2.get_stats("bureau")
         assert stats["samples"] == 5
+        assert learner2.loaded is True
+
+    def test_observations_saved_in_one_delayed_write(self, learner, mock_hass, store_path):
+        """Test that observations are batched into a delayed write."""
+        for _ in range(3):
+            learner.record_observation("bureau", 1.5, hour=10)
+
+        mock_hass.loop.call_at.assert_called_with(LEARNING_SAVE_DELAY, ANY)
+        assert not store_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_pending_observations_written_on_stop(self, learner, mock_hass):
+        """Test that observations still waiting for the delay are written when HA stops."""
+        for _ in range(3):
+            learner.record_observation("bureau", 1.5, hour=10)
+
+        event_type, final_write = mock_hass.bus.async_listen_once.call_args.args
+        assert event_type == EVENT_HOMEASSISTANT_FINAL_WRITE
+        await final_write(None)
+
+        reloaded = HeatingRateLearner(mock_hass)
+        await reloaded.async_load()
+        assert reloaded.get_stats("bureau")["samples"] == 3
+
+    @pytest.mark.asyncio
+    async def test_flush_without_pending_save(self, learner, mock_hass):
+        """Test that flushing does not write when nothing was recorded."""
+        await learner.async_flush()
+
+        mock_hass.async_add_executor_job.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_legacy_file_migrated(self, mock_hass, tmp_path, store_path):
+        """Test that the former raw JSON file is moved into the store."""
+        legacy_path = tmp_path / STORAGE_DIR / LEGACY_LEARNING_FILE
+        legacy_path.parent.mkdir()
+        legacy_path.write_text(json.dumps({"bureau": [{"rate": 1.5, "hour": 10}]}))
+
+        learner = HeatingRateLearner(mock_hass)
+        await learner.async_load()
+
+        assert learner.get_stats("bureau")["samples"] == 1
+        assert not legacy_path.exists()
+        assert store_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_keeps_last_samples(self, learner, mock_hass):
+        """Test that only the most recent samples are kept and persisted."""
+        for i in range(LEARNING_MAX_SAMPLES + 10):
+            learner.record_observation("bureau", 1.0 + (i % 2), hour=i % 24)
+        await learner.async_flush()
+
+        reloaded = HeatingRateLearner(mock_hass)
+        await reloaded.async_load()
+
+        assert learner.get_stats("bureau")["samples"] == LEARNING_MAX_SAMPLES
+        assert list(reloaded._data["bureau"]) == list(learner._data["bureau"])
+        assert reloaded._data["bureau"][0]["hour"] == 10
 
     def test_multiple_rooms_independent(self, learner):
         """Test that different rooms have independent data."""
@@ -165,6 +252,17 @@ class TestHeatingRateLearner:
         assert stats["min_rate"] == 1.0
         assert stats["max_rate"] == 3.0
 
+    def test_stats_cached_until_next_observation(self, learner):
+        """Test that statistics are reused until a new sample is recorded."""
+        learner.record_observation("bureau", 1.0, hour=10)
+        stats = learner.get_stats("bureau")
+
+        assert learner.get_stats("bureau") is stats
+
+        learner.record_observation("bureau", 3.0, hour=10)
+
+        assert learner.get_stats("bureau")["avg_rate"] == pytest.approx(2.0, rel=0.01)
+
     def test_same_time_period_detection(self, learner):
         """Test time period detection logic."""
         # Morning (6-12)
@@ -184,6 +282,13 @@ class TestHeatingRateLearner:
         assert learner._same_time_period(23, 10) is False
 
 
+    def test_time_period_boundaries(self):
+        """Test the period table at each period boundary."""
+        periods = [_time_period(hour) for hour in (5, 6, 11, 12, 17, 18, 21, 22, 23)]
+
+        assert periods == [0, 1, 1, 2, 2, 3, 3, 0, 0]
+
+
 class TestCoordinatorLearningIntegration:
     """Test learning integration with coordinator."""
 
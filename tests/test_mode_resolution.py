@@ -78,6 +78,25 @@ class TestModeResolution:
         assert mode == MODE_ECO
         assert source == SOURCE_DEFAULT
 
+    def test_confort_room_matched_by_name_or_id(self, coordinator):
+        """Test that room comfort events match the lowercased name or id."""
+        parsed_events = {
+            "absence": False,
+            "confort_global": False,
+            "confort_pieces": {"salon", "grenier"},
+        }
+
+        assert coordinator._get_piece_names("salon") == ("salon", "salon")
+        assert coordinator._resolve_mode("salon", parsed_events, True) == (
+            MODE_CONFORT,
+            SOURCE_CALENDAR,
+        )
+        # Unknown rooms fall back to their lowercased id
+        assert coordinator._resolve_mode("Grenier", parsed_events, True) == (
+            MODE_CONFORT,
+            SOURCE_CALENDAR,
+        )
+
     def test_no_events_returns_eco(self, coordinator):
         """Test that no events returns eco mode by default."""
         parsed_events = {
@@ -136,6 +155,41 @@ class TestModeResolution:
         assert "bureau" not in coordinator._mode_overrides
 
 
+    def test_override_expiry_uses_update_time(self, coordinator):
+        """Test that the override expiry is checked against the given update time."""
+        expiry = datetime.now() + timedelta(minutes=10)
+        coordinator._mode_overrides["bureau"] = (MODE_CONFORT, expiry)
+        parsed_events = {
+            "absence": False,
+            "confort_global": False,
+            "confort_pieces": set(),
+        }
+
+        mode, source = coordinator._resolve_mode(
+            "bureau", parsed_events, True, now=expiry + timedelta(minutes=1)
+        )
+
+        assert (mode, source) == (MODE_ECO, SOURCE_DEFAULT)
+        assert "bureau" not in coordinator._mode_overrides
+
+
+    def test_global_mode_independent_of_room(self, coordinator):
+        """Test that absence and presence resolve without room events."""
+        parsed_events = {
+            "absence": False,
+            "confort_global": False,
+            "confort_pieces": {"bureau"},
+        }
+
+        assert coordinator._resolve_global(parsed_events, True) is None
+        assert coordinator._resolve_global(parsed_events, False) == (MODE_ECO, SOURCE_PRESENCE)
+        parsed_events["absence"] = True
+        assert coordinator._resolve_global(parsed_events, True) == (
+            MODE_HORS_GEL,
+            SOURCE_CALENDAR,
+        )
+
+
 class TestPresenceComputation:
     """Test presence computation logic."""
 
@@ -1,14 +1,25 @@
 """Tests for preheat calculation logic."""
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from custom_components.chauffage_intelligent.const import (
+    CONF_PIECE_RADIATEURS,
+    CONF_PIECES,
+    CONF_PRESENCE_TRACKERS,
+    CONF_SECURITY_FACTOR,
+    CONF_UPDATE_INTERVAL,
     DEFAULT_HEATING_RATE,
     DEFAULT_MIN_PREHEAT_TIME,
     DEFAULT_SECURITY_FACTOR,
 )
+from custom_components.chauffage_intelligent.coordinator import _normalize_events
+
+
+def _next_comfort(coordinator, piece_id, events):
+    """Return the next comfort event of a room from raw calendar events."""
+    return coordinator._find_next_comfort_events(_normalize_events(events)).get(piece_id)
 
 
 class TestPreheatTimeCalculation:
@@ -118,8 +129,7 @@ class TestPreheatTrigger:
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
             result = coordinator._check_preheat_trigger(
-                "bureau",
-                events,
+                _next_comfort(coordinator, "bureau", events),
                 preheat_time=60,  # 1 hour
             )
 
@@ -134,8 +144,7 @@ class TestPreheatTrigger:
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
             result = coordinator._check_preheat_trigger(
-                "bureau",
-                events,
+                _next_comfort(coordinator, "bureau", events),
                 preheat_time=90,  # 1.5 hours
             )
 
@@ -149,8 +158,7 @@ class TestPreheatTrigger:
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
             result = coordinator._check_preheat_trigger(
-                "bureau",
-                events,
+                _next_comfort(coordinator, "bureau", events),
                 preheat_time=60,
             )
 
@@ -167,15 +175,13 @@ class TestPreheatTrigger:
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
             # Bureau should trigger
             result_bureau = coordinator._check_preheat_trigger(
-                "bureau",
-                events,
+                _next_comfort(coordinator, "bureau", events),
                 preheat_time=60,
             )
 
             # Salon should not trigger
             result_salon = coordinator._check_preheat_trigger(
-                "salon",
-                events,
+                _next_comfort(coordinator, "salon", events),
                 preheat_time=60,
             )
 
@@ -192,14 +198,12 @@ class TestPreheatTrigger:
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
             result_bureau = coordinator._check_preheat_trigger(
-                "bureau",
-                events,
+                _next_comfort(coordinator, "bureau", events),
                 preheat_time=60,
             )
 
             result_salon = coordinator._check_preheat_trigger(
-                "salon",
-                events,
+                _next_comfort(coordinator, "salon", events),
                 preheat_time=60,
             )
 
@@ -215,10 +219,63 @@ class TestPreheatTrigger:
 
         with patch("homeassistant.util.dt.now", return_value=datetime.now()):
             result = coordinator._check_preheat_trigger(
-                "bureau",
-                events,
+                _next_comfort(coordinator, "bureau", events),
                 preheat_time=60,
             )
 
         # Event already started, so no anticipation needed
         assert result is False
+
+
+    def test_next_comfort_event_per_room(self, coordinator, calendar_event_factory):
+        """Test that each room gets its earliest upcoming comfort event."""
+        events = _normalize_events(
+            [
+                calendar_event_factory("Confort Salon", offset_minutes=90),
+                calendar_event_factory("Confort", offset_minutes=120),
+                calendar_event_factory("Confort - Bureau", offset_minutes=30),
+                calendar_event_factory("Confort Chambre", offset_minutes=-10),
+            ]
+        )
+
+        with patch("homeassistant.util.dt.now", return_value=datetime.now()):
+            next_events = coordinator._find_next_comfort_events(events)
+
+        assert next_events == {
+            "bureau": events[2],
+            "salon": events[0],
+            "chambre": events[1],
+        }
+
+    def test_no_next_event_no_trigger(self, coordinator):
+        """Test that a room without upcoming comfort event is not preheated."""
+        assert coordinator._check_preheat_trigger(None, preheat_time=60) is False
+
+
+class TestSettingsUpdate:
+    """Test applying updated settings without a reload."""
+
+    def test_tunables_applied_in_place(self, coordinator, basic_config):
+        """Test that preheat settings are applied to the running coordinator."""
+        config = {**basic_config, CONF_SECURITY_FACTOR: 1.8, CONF_UPDATE_INTERVAL: 600}
+
+        assert coordinator.async_update_settings(config) is True
+        assert coordinator.security_factor == 1.8
+        assert coordinator.update_interval == timedelta(minutes=10)
+
+    def test_legacy_radiators_do_not_force_reload(self, coordinator, basic_config):
+        """Test that an unchanged legacy radiator string counts as unchanged."""
+        pieces = {**basic_config[CONF_PIECES]}
+        pieces["bureau"] = {**pieces["bureau"], CONF_PIECE_RADIATEURS: "climate.bilbao_bureau"}
+        config = {**basic_config, CONF_PIECES: pieces, CONF_UPDATE_INTERVAL: 300}
+
+        assert coordinator.async_update_settings(config) is True
+
+    def test_structural_change_needs_reload(self, coordinator, basic_config):
+        """Test that changed rooms or trackers are not applied in place."""
+        trackers = {**basic_config, CONF_PRESENCE_TRACKERS: ["device_tracker.phone_1"]}
+        pieces = {**basic_config, CONF_PIECES: {"bureau": basic_config[CONF_PIECES]["bureau"]}}
+
+        assert coordinator.async_update_settings(trackers) is False
+        assert coordinator.async_update_settings(pieces) is False
+        assert coordinator.security_factor == DEFAULT_SECURITY_FACTOR
@@ -0,0 +1,55 @@
+"""Tests for applying the target temperature to radiators."""
+from __future__ import annotations
+
+import pytest
+
+
+class TestRadiatorWrites:
+    """Test radiator temperature writes."""
+
+    @pytest.mark.asyncio
+    async def test_all_radiators_written(self, coordinator, mock_hass, mock_state):
+        """Test that every radiator receives the target temperature."""
+        mock_hass.states.get.side_effect = lambda entity_id: {
+            "climate.salon_1": mock_state("heat", {"temperature": 17}),
+        }.get(entity_id)
+
+        await coordinator._set_radiators_temperature(
+            ["climate.salon_1", "climate.salon_2"], 20
+        )
+
+        written = [
+            call.args[2]["entity_id"] for call in mock_hass.services.async_call.call_args_list
+        ]
+        assert written == ["climate.salon_1", "climate.salon_2"]
+
+    @pytest.mark.asyncio
+    async def test_radiator_at_target_skipped(self, coordinator, mock_hass, mock_state):
+        """Test that radiators already at the target are not written again."""
+        mock_hass.states.get.side_effect = lambda entity_id: {
+            "climate.salon_1": mock_state("heat", {"temperature": 20.0}),
+            "climate.salon_2": mock_state("heat", {"temperature": 17.0}),
+        }.get(entity_id)
+
+        await coordinator._set_radiators_temperature(
+            ["climate.salon_1", "climate.salon_2"], 20
+        )
+
+        mock_hass.services.async_call.assert_awaited_once_with(
+            "climate",
+            "set_temperature",
+            {"entity_id": "climate.salon_2", "temperature": 20},
+            blocking=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_radiator_does_not_block_others(self, coordinator, mock_hass):
+        """Test that a failing radiator does not prevent the other writes."""
+        mock_hass.states.get.return_value = None
+        mock_hass.services.async_call.side_effect = [Exception("offline"), None]
+
+        await coordinator._set_radiators_temperature(
+            ["climate.salon_1", "climate.salon_2"], 20
+        )
+
+        assert mock_hass.services.async_call.await_count == 2
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -179,6 +179,35 @@ class TestChauffageIntelligentModeSelect:
             "source": "calendrier",
         }
 
+    def test_coordinator_update_refreshes_cached_state(self, coordinator):
+        """Test that a coordinator update refreshes the cached option and attributes."""
+        coordinator.data = {"pieces": {"bureau": {"mode": "confort", "source": "calendrier"}}}
+        select = ChauffageIntelligentModeSelect(coordinator, "bureau", {})
+        select.async_write_ha_state = MagicMock()
+
+        coordinator.data = {"pieces": {"bureau": {"mode": MODE_ECO, "source": SOURCE_OVERRIDE}}}
+        select._handle_coordinator_update()
+
+        assert select.current_option == "Éco"
+        assert select.extra_state_attributes == {
+            "calculated_mode": MODE_ECO,
+            "source": SOURCE_OVERRIDE,
+        }
+        select.async_write_ha_state.assert_called_once()
+
+    def test_coordinator_update_skips_unchanged_option(self, coordinator):
+        """Test that an unchanged option does not trigger a new state write."""
+        coordinator.data = {"pieces": {"bureau": {"mode": "confort", "source": "calendrier"}}}
+        select = ChauffageIntelligentModeSelect(coordinator, "bureau", {})
+        select.async_write_ha_state = MagicMock()
+
+        select._handle_coordinator_update()
+        coordinator.data["pieces"]["bureau"]["consigne"] = 19
+        select._handle_coordinator_update()
+
+        select.async_write_ha_state.assert_called_once()
+
+
 
 class TestLabelToMode:
     """Test _label_to_mode helper function."""
@@ -1,6 +1,8 @@
 """Tests for sensor entities."""
 from __future__ import annotations
 
+from unittest.mock import MagicMock
+
 from custom_components.chauffage_intelligent.const import CONF_PIECE_NAME, DOMAIN
 from custom_components.chauffage_intelligent.sensor import (
     GlobalModeSensor,
@@ -46,6 +48,18 @@ class TestGlobalModeSensor:
 
         assert sensor.native_value == "eco"
 
+    def test_native_value_tie_goes_to_first_room(self, coordinator):
+        """Test native_value is stable when modes are tied."""
+        coordinator.data = {
+            "pieces": {
+                "bureau": {"mode": "eco"},
+                "salon": {"mode": "confort"},
+            }
+        }
+        sensor = GlobalModeSensor(coordinator)
+
+        assert sensor.native_value == "eco"
+
     def test_native_value_when_no_data(self, coordinator):
         """Test native_value returns None when no data."""
         coordinator.data = None
@@ -134,6 +148,31 @@ class TestRoomModeSensor:
 
         assert sensor.extra_state_attributes == {}
 
+    def test_coordinator_update_refreshes_cached_state(self, coordinator):
+        """Test that a coordinator update refreshes the cached value and attributes."""
+        coordinator.data = {"pieces": {"bureau": {"mode": "eco", "source": "calendrier"}}}
+        sensor = RoomModeSensor(coordinator, "bureau", {})
+        sensor.async_write_ha_state = MagicMock()
+
+        coordinator.data = {"pieces": {"bureau": {"mode": "confort", "source": "override"}}}
+        sensor._handle_coordinator_update()
+
+        assert sensor.native_value == "confort"
+        assert sensor.extra_state_attributes == {"source": "override"}
+        sensor.async_write_ha_state.assert_called_once()
+
+    def test_coordinator_update_skips_unchanged_mode(self, coordinator):
+        """Test that an unchanged mode and source do not trigger a new state write."""
+        coordinator.data = {"pieces": {"bureau": {"mode": "eco", "source": "calendrier"}}}
+        sensor = RoomModeSensor(coordinator, "bureau", {})
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_coordinator_update()
+        coordinator.data["pieces"]["bureau"]["consigne"] = 17
+        sensor._handle_coordinator_update()
+
+        sensor.async_write_ha_state.assert_called_once()
+
 
 class TestRoomTargetTempSensor:
     """Test RoomTargetTempSensor."""
@@ -255,3 +294,27 @@ class TestRoomHeatingRateSensor:
         sensor = RoomHeatingRateSensor(coordinator, "bureau", {})
 
         assert sensor.native_value is None
+
+    def test_coordinator_update_refreshes_rounded_rate(self, coordinator):
+        """Test that a coordinator update refreshes the cached rounded rate."""
+        coordinator.data = {"pieces": {"bureau": {"vitesse_chauffe": 1.0}}}
+        sensor = RoomHeatingRateSensor(coordinator, "bureau", {})
+        sensor.async_write_ha_state = MagicMock()
+
+        coordinator.data = {"pieces": {"bureau": {"vitesse_chauffe": 1.456}}}
+        sensor._handle_coordinator_update()
+
+        assert sensor.native_value == 1.46
+        sensor.async_write_ha_state.assert_called_once()
+
+    def test_coordinator_update_skips_unchanged_value(self, coordinator):
+        """Test that an unchanged rate does not trigger a new state write."""
+        coordinator.data = {"pieces": {"bureau": {"vitesse_chauffe": 1.234}}}
+        sensor = RoomHeatingRateSensor(coordinator, "bureau", {})
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._handle_coordinator_update()
+        coordinator.data = {"pieces": {"bureau": {"vitesse_chauffe": 1.2341, "mode": "eco"}}}
+        sensor._handle_coordinator_update()
+
+        sensor.async_write_ha_state.assert_called_once()
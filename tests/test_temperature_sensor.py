@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+from unittest.mock import patch
+
 from custom_components.chauffage_intelligent.const import (
     CONF_PIECE_RADIATEURS,
     CONF_PIECE_SONDE,
+    CONF_PIECES,
+)
+from custom_components.chauffage_intelligent.coordinator import (
+    ChauffageIntelligentCoordinator,
+    as_radiator_list,
 )
 
 
@@ -143,3 +151,67 @@ class TestTemperatureSensorFallback:
         result = coordinator._get_temperature(piece_config)
 
         assert result is None
+
+    def test_legacy_single_radiator_normalized(self, mock_hass, basic_config, mock_state):
+        """Test that a legacy single radiator string is handled as a list."""
+        basic_config[CONF_PIECES]["bureau"][CONF_PIECE_RADIATEURS] = "climate.bilbao_bureau"
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = ChauffageIntelligentCoordinator(
+                mock_hass, basic_config, update_interval=timedelta(minutes=5)
+            )
+        mock_hass.states.get.side_effect = lambda entity_id: {
+            "climate.bilbao_bureau": mock_state("heat", {"current_temperature": 18.0}),
+        }.get(entity_id)
+
+        piece_config = coordinator.pieces["bureau"]
+
+        assert piece_config[CONF_PIECE_RADIATEURS] == ["climate.bilbao_bureau"]
+        assert coordinator._get_temperature(piece_config) == 18.0
+
+    def test_missing_radiators_normalized(self, mock_hass, basic_config):
+        """Test that a room without radiators gets an empty list."""
+        del basic_config[CONF_PIECES]["bureau"][CONF_PIECE_RADIATEURS]
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = ChauffageIntelligentCoordinator(
+                mock_hass, basic_config, update_interval=timedelta(minutes=5)
+            )
+
+        assert coordinator.pieces["bureau"][CONF_PIECE_RADIATEURS] == []
+        assert as_radiator_list(None) == []
+
+
+class TestOutdoorTemperature:
+    """Test outdoor temperature lookup."""
+
+    def test_weather_attribute_used(self, coordinator, mock_hass, mock_state):
+        """Test that a weather entity provides its temperature attribute."""
+        mock_hass.states.get.side_effect = lambda entity_id: {
+            "weather.maison": mock_state("sunny", {"temperature": 4.5}),
+        }.get(entity_id)
+
+        assert coordinator._get_outdoor_temperature() == 4.5
+        assert coordinator._outdoor_entity == "weather.maison"
+
+    def test_last_entity_tried_first(self, coordinator, mock_hass, mock_state):
+        """Test that the previously matching entity is read without scanning."""
+        states = {"sensor.outdoor_temperature": mock_state("3.0")}
+        mock_hass.states.get.side_effect = states.get
+        coordinator._get_outdoor_temperature()
+        mock_hass.states.get.reset_mock()
+
+        states["sensor.outdoor_temperature"] = mock_state("2.0")
+
+        assert coordinator._get_outdoor_temperature() == 2.0
+        mock_hass.states.get.assert_called_once_with("sensor.outdoor_temperature")
+
+    def test_rescan_when_entity_disappears(self, coordinator, mock_hass, mock_state):
+        """Test that another candidate is used when the last one is gone."""
+        states = {"weather.home": mock_state("cloudy", {"temperature": 6.0})}
+        mock_hass.states.get.side_effect = states.get
+        coordinator._get_outdoor_temperature()
+
+        states.clear()
+        states["sensor.temperature_exterieure"] = mock_state("unavailable")
+
+        assert coordinator._get_outdoor_temperature() is None
+        assert coordinator._outdoor_entity is None